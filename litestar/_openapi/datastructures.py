@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
-from typing import TYPE_CHECKING, Iterator, Sequence, _GenericAlias  # type: ignore[attr-defined]
+from typing import TYPE_CHECKING, Any, Iterator, Sequence, _GenericAlias  # type: ignore[attr-defined]
 
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.openapi.spec import Reference, Schema
@@ -101,6 +101,22 @@ class SchemaRegistry:
         self._schema_reference_map: dict[int, RegisteredSchema] = {}
         self._model_name_groups: defaultdict[str, list[RegisteredSchema]] = defaultdict(list)
         self._component_type_map: dict[tuple[str, ...], FieldDefinition] = {}
+        self._annotation_key_map: dict[int, tuple[Any, tuple[str, ...]]] = {}
+
+    def _get_schema_key(self, field: FieldDefinition) -> tuple[str, ...]:
+        """Get the key for ``field``, normalizing each annotation only once per registry.
+
+        Keys are stored by annotation identity, because equal annotations are not interchangeable, e.g.
+        ``Union[int, str] == Union[str, int]`` while their keys differ. The annotation is stored along with its key, so
+        that its ``id`` cannot be reused while the registry is alive.
+        """
+        if _get_component_key_override(field):
+            return _get_normalized_schema_key(field)
+
+        annotation = field.annotation
+        if (cached := self._annotation_key_map.get(id(annotation))) is None:
+            cached = self._annotation_key_map[id(annotation)] = (annotation, _get_normalized_schema_key(field))
+        return cached[1]
 
     def get_schema_for_field_definition(self, field: FieldDefinition) -> Schema:
         """Get a registered schema by its key.
@@ -111,7 +127,7 @@ class SchemaRegistry:
         Returns:
             A RegisteredSchema object.
         """
-        key = _get_normalized_schema_key(field)
+        key = self._get_schema_key(field)
         if key not in self._schema_key_map:
             self._schema_key_map[key] = registered_schema = RegisteredSchema(key, Schema(), [])
             self._model_name_groups[key[-1]].append(registered_schema)
@@ -133,7 +149,7 @@ class SchemaRegistry:
         Returns:
             A Reference object.
         """
-        key = _get_normalized_schema_key(field)
+        key = self._get_schema_key(field)
         if key not in self._schema_key_map:
             return None
 
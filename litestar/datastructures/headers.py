@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 from contextlib import suppress
 from copy import copy
 from dataclasses import dataclass, fields
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -322,11 +323,10 @@ class CacheControlHeader(Header):
         """
 
         kwargs: Dict[str, Any] = {}
-        field_names = {f.name for f in fields(cls)}
+        directives = _get_cache_control_directives(cls)
         for cc_item in (stripped for v in header_value.split(",") if (stripped := v.strip())):
-            key, *value = cc_item.split("=", maxsplit=1)
-            key = key.replace("-", "_")
-            if key not in field_names:
+            directive, *value = cc_item.split("=", maxsplit=1)
+            if (key := directives.get(directive)) is None:
                 raise ImproperlyConfiguredException("Invalid cache-control header")
             if not value:
                 kwargs[key] = True
@@ -347,6 +347,15 @@ class CacheControlHeader(Header):
         return cls(no_store=True)
 
 
+@lru_cache(1024)
+def _get_cache_control_directives(header_cls: type) -> Dict[str, str]:
+    """Map the directive names accepted by a ``cache-control`` header class to its field names."""
+    directives: Dict[str, str] = {}
+    for field in fields(header_cls):
+        directives[field.name] = directives[field.name.replace("_", "-")] = field.name
+    return directives
+
+
 @dataclass
 class ETag(Header):
     """An ``etag`` header."""
@@ -5,6 +5,7 @@ back again, to bytes.
 from __future__ import annotations
 
 from dataclasses import replace
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
@@ -36,8 +37,9 @@ from litestar.dto._types import (
 from litestar.dto.data_structures import DTOData, DTOFieldDefinition
 from litestar.dto.field import Mark
 from litestar.enums import RequestEncodingType
+from litestar.exceptions import SerializationException
 from litestar.params import KwargDefinition
-from litestar.serialization import decode_json, decode_msgpack
+from litestar.serialization import default_deserializer
 from litestar.types import Empty
 from litestar.typing import FieldDefinition
 from litestar.utils import unique_name_for_scope
@@ -45,6 +47,7 @@ from litestar.utils import unique_name_for_scope
 if TYPE_CHECKING:
     from litestar.connection import ASGIConnection
     from litestar.dto import AbstractDTO, RenameStrategy
+    from litestar.types import TypeDecodersSequence
     from litestar.types.serialization import LitestarEncodableType
 
 __all__ = ("DTOBackend",)
@@ -64,6 +67,7 @@ class CompositeTypeHandler(Protocol):
 
 class DTOBackend:
     __slots__ = (
+        "_decoders",
         "annotation",
         "dto_data_type",
         "dto_factory",
@@ -122,6 +126,7 @@ class DTOBackend:
             field_definition = self.field_definition.inner_types[0]
 
         self.annotation = build_annotation_for_backend(model_type, field_definition, self.transfer_model_type)
+        self._decoders: dict[tuple[bool, tuple[Any, ...]], msgspec.json.Decoder | msgspec.msgpack.Decoder] = {}
 
     def parse_model(
         self,
@@ -138,7 +143,7 @@ class DTOBackend:
         """
         defined_fields = []
         generic_field_definitons = list(FieldDefinition.from_annotation(model_type).generic_types or ())
-        for field_definition in self.dto_factory.generate_field_definitions(model_type):
+        for field_definition in self._get_model_field_definitions(model_type):
             if field_definition.is_type_var:
                 base_arg_field = generic_field_definitons.pop()
                 field_definition = replace(
@@ -176,6 +181,23 @@ class DTOBackend:
             defined_fields.append(transfer_field_definition)
         return tuple(defined_fields)
 
+    def _get_model_field_definitions(self, model_type: Any) -> tuple[DTOFieldDefinition, ...]:
+        """Generate the field definitions of ``model_type``, once per DTO factory and model type.
+
+        The same model is parsed by the data and return backends of every handler that uses the DTO, so the
+        generated field definitions are stored on the DTO factory and shared between them rather than being rebuilt
+        for each backend.
+        """
+        cache = self.dto_factory._model_field_definitions
+        try:
+            return cache[model_type]
+        except KeyError:
+            field_definitions = cache[model_type] = tuple(self.dto_factory.generate_field_definitions(model_type))
+            return field_definitions
+        except TypeError:
+            # unhashable model type annotation
+            return tuple(self.dto_factory.generate_field_definitions(model_type))
+
     def _create_transfer_model_name(self, model_name: str) -> str:
         long_name_prefix = self.handler_id.split("::")[0]
         short_name_prefix = _camelize(long_name_prefix.split(".")[-1], True)
@@ -233,15 +255,39 @@ class DTOBackend:
         if (content_type := getattr(asgi_connection, "content_type", None)) and (media_type := content_type[0]):
             request_encoding = media_type
 
-        type_decoders = asgi_connection.route_handler.resolve_type_decoders()
-
-        if request_encoding == RequestEncodingType.MESSAGEPACK:
-            result = decode_msgpack(value=raw, target_type=self.annotation, type_decoders=type_decoders, strict=False)
-        else:
-            result = decode_json(value=raw, target_type=self.annotation, type_decoders=type_decoders, strict=False)
+        decoder = self._get_decoder(
+            is_msgpack=request_encoding == RequestEncodingType.MESSAGEPACK,
+            type_decoders=asgi_connection.route_handler.resolve_type_decoders(),
+        )
+        try:
+            result = decoder.decode(raw)
+        except msgspec.DecodeError as msgspec_error:
+            raise SerializationException(str(msgspec_error)) from msgspec_error
 
         return cast("Struct | Collection[Struct]", result)
 
+    def _get_decoder(
+        self, is_msgpack: bool, type_decoders: TypeDecodersSequence
+    ) -> msgspec.json.Decoder | msgspec.msgpack.Decoder:
+        """Get a decoder for the transfer model annotation, creating it on first use.
+
+        Args:
+            is_msgpack: Whether the raw data is MessagePack encoded, otherwise JSON is assumed.
+            type_decoders: Type decoders of the route handler that received the data.
+
+        Returns:
+            A decoder bound to the transfer model annotation.
+        """
+        key = (is_msgpack, tuple(type_decoders))
+        if (decoder := self._decoders.get(key)) is None:
+            decoder_type = msgspec.msgpack.Decoder if is_msgpack else msgspec.json.Decoder
+            decoder = self._decoders[key] = decoder_type(
+                type=self.annotation,
+                dec_hook=partial(default_deserializer, type_decoders=type_decoders),
+                strict=False,
+            )
+        return decoder
+
     def parse_builtins(self, builtins: Any, asgi_connection: ASGIConnection) -> Any:
         """Parse builtin types into transfer model type.
 
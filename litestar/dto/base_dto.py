@@ -5,6 +5,7 @@ import typing
 from abc import abstractmethod
 from inspect import getmodule
 from typing import TYPE_CHECKING, Collection, Generic, TypeVar
+from weakref import WeakValueDictionary
 
 from typing_extensions import NotRequired, TypedDict, get_type_hints
 
@@ -35,6 +36,9 @@ __all__ = ("AbstractDTO",)
 
 T = TypeVar("T")
 
+_DEFAULT_CONFIG = DTOConfig()
+"""Configuration shared by DTO types that are narrowed without a configuration of their own."""
+
 
 class _BackendDict(TypedDict):
     data_backend: NotRequired[DTOBackend]
@@ -52,6 +56,14 @@ class AbstractDTO(Generic[T]):
     """If ``annotation`` is an iterable, this is the inner type, otherwise will be the same as ``annotation``."""
 
     _dto_backends: ClassVar[dict[str, _BackendDict]] = {}
+    _narrowed_types: ClassVar[WeakValueDictionary[tuple[type[AbstractDTO], int, Any], type[AbstractDTO]]] = (
+        WeakValueDictionary()
+    )
+    """Narrowed types by DTO type and type argument identity, kept only for as long as the narrowed type is
+    referenced.
+    """
+    _model_field_definitions: ClassVar[dict[Any, tuple[DTOFieldDefinition, ...]]]
+    """Field definitions generated by this DTO type, by model type. Set per subclass."""
 
     def __init__(self, asgi_connection: ASGIConnection) -> None:
         """Create an AbstractDTOFactory type.
@@ -62,6 +74,28 @@ class AbstractDTO(Generic[T]):
         self.asgi_connection = asgi_connection
 
     def __class_getitem__(cls, annotation: Any) -> type[Self]:
+        """Narrow the DTO type to ``annotation``.
+
+        Narrowed types are cached by DTO type and by the identity of ``annotation``, so subscripting with the same
+        annotation object returns the same class while it is referenced, while equal but distinct annotation objects
+        get classes of their own.
+        """
+        if hasattr(annotation, "__metadata__"):
+            # ``Annotated`` type arguments may carry a ``DTOConfig`` instance that must be set on the narrowed type
+            return cls._narrow_type(annotation)
+
+        # the annotation is part of the key so that its ``id`` cannot be reused while the entry exists
+        key = (cls, id(annotation), annotation)
+        try:
+            return cls._narrowed_types[key]  # type: ignore[return-value]
+        except KeyError:
+            narrowed_type = cls._narrowed_types[key] = cls._narrow_type(annotation)
+            return narrowed_type
+        except TypeError:
+            return cls._narrow_type(annotation)
+
+    @classmethod
+    def _narrow_type(cls, annotation: Any) -> type[Self]:
         field_definition = FieldDefinition.from_annotation(annotation)
 
         if (field_definition.is_optional and len(field_definition.args) > 2) or (
@@ -78,7 +112,7 @@ class AbstractDTO(Generic[T]):
         if not config:
             if field_definition.is_type_var:
                 return cls
-            config = cls.config if hasattr(cls, "config") else DTOConfig()
+            config = cls.config if hasattr(cls, "config") else _DEFAULT_CONFIG
 
         cls_dict: dict[str, Any] = {"config": config, "_type_backend_map": {}, "_handler_backend_map": {}}
         if not field_definition.is_type_var:
@@ -87,6 +121,7 @@ class AbstractDTO(Generic[T]):
         return type(f"{cls.__name__}[{annotation}]", (cls,), cls_dict)  # pyright: ignore
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
+        cls._model_field_definitions = {}
         if (config := getattr(cls, "config", None)) and (model_type := getattr(cls, "model_type", None)):
             # it's a concrete class
             cls.config = cls.get_config_for_model_type(config, model_type)
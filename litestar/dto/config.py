@@ -17,7 +17,7 @@ __all__ = ("DTOConfig",)
 class DTOConfig:
     """Control the generated DTO."""
 
-    exclude: AbstractSet[str] = field(default_factory=set)
+    exclude: AbstractSet[str] = field(default_factory=frozenset)
     """Explicitly exclude fields from the generated DTO.
 
     If exclude is specified, all fields not specified in exclude will be included by default.
@@ -28,7 +28,7 @@ class DTOConfig:
         - 'exclude' mutually exclusive with 'include' - specifying both values will raise an
             ``ImproperlyConfiguredException``.
     """
-    include: AbstractSet[str] = field(default_factory=set)
+    include: AbstractSet[str] = field(default_factory=frozenset)
     """Explicitly include fields in the generated DTO.
 
     If include is specified, all fields not specified in include will be excluded by default.
@@ -66,3 +66,6 @@ class DTOConfig:
             raise ImproperlyConfiguredException(
                 "'include' and 'exclude' are mutually exclusive options, please use one of them"
             )
+        # the config is frozen, so its field name sets shouldn't be mutable either
+        object.__setattr__(self, "exclude", frozenset(self.exclude))
+        object.__setattr__(self, "include", frozenset(self.include))
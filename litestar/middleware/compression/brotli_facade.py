@@ -18,6 +18,13 @@ if TYPE_CHECKING:
     from litestar.config.compression import CompressionConfig
 
 
+_BROTLI_MODES: dict[Literal["generic", "text", "font"], int] = {
+    "text": int(MODE_TEXT),
+    "font": int(MODE_FONT),
+    "generic": int(MODE_GENERIC),
+}
+
+
 class BrotliCompression(CompressionFacade):
     __slots__ = ("buffer", "compression_encoding", "compressor")
 
@@ -31,14 +38,9 @@ class BrotliCompression(CompressionFacade):
     ) -> None:
         self.buffer = buffer
         self.compression_encoding = compression_encoding
-        modes: dict[Literal["generic", "text", "font"], int] = {
-            "text": int(MODE_TEXT),
-            "font": int(MODE_FONT),
-            "generic": int(MODE_GENERIC),
-        }
         self.compressor = Compressor(
             quality=config.brotli_quality,
-            mode=modes[config.brotli_mode],
+            mode=_BROTLI_MODES[config.brotli_mode],
             lgwin=config.brotli_lgwin,
             lgblock=config.brotli_lgblock,
         )
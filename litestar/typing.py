@@ -6,6 +6,7 @@ from collections import abc
 from copy import deepcopy
 from dataclasses import dataclass, is_dataclass, replace
 from enum import Enum
+from functools import lru_cache
 from inspect import Parameter, Signature
 from typing import Any, AnyStr, Callable, Collection, ForwardRef, Literal, Mapping, TypeVar, cast
 
@@ -46,6 +47,7 @@ from litestar.utils.typing import (
     get_type_hints_with_generics_resolved,
     make_non_optional_union,
     unwrap_annotation,
+    wrapper_type_set,
 )
 
 __all__ = ("FieldDefinition",)
@@ -148,6 +150,9 @@ class FieldDefinition:
         return type(self)(**{attr: deepcopy(getattr(self, attr)) for attr in self.__slots__})
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, FieldDefinition):
             return False
 
@@ -415,7 +420,19 @@ class FieldDefinition:
         Returns:
             FieldDefinition
         """
+        if not kwargs and get_origin(annotation) not in wrapper_type_set:
+            try:
+                hash(annotation)
+            except TypeError:  # unhashable annotation
+                pass
+            else:
+                # cached instances are shared, so each caller gets its own mutable ``extra`` mapping
+                return replace(_parse_plain_annotation(id(annotation), annotation), extra={})
 
+        return cls._from_annotation(annotation, **kwargs)
+
+    @classmethod
+    def _from_annotation(cls, annotation: Any, **kwargs: Any) -> FieldDefinition:
         unwrapped, metadata, wrappers = unwrap_annotation(annotation if annotation is not Empty else Any)
         origin = get_origin(unwrapped)
 
@@ -437,7 +454,7 @@ class FieldDefinition:
                         "'param: Annotated[<type>, Parameter(...)] = <default>' instead of "
                         "'param: Annotated[<type>, Parameter(..., default=<default>)].",
                         category=DeprecationWarning,
-                        stacklevel=2,
+                        stacklevel=3,
                     )
                     if kwargs.get("default", Empty) is not Empty and kwarg_definition.default != kwargs["default"]:
                         warnings.warn(
@@ -445,7 +462,7 @@ class FieldDefinition:
                             f"'{kwarg_definition.default!r}' set inside the parameter annotation differs from the "
                             f"parameter default value '{kwargs['default']!r}'",
                             category=LitestarWarning,
-                            stacklevel=2,
+                            stacklevel=3,
                         )
 
                 metadata = tuple(v for v in metadata if not isinstance(v, (KwargDefinition, DependencyKwarg)))
@@ -575,3 +592,13 @@ class FieldDefinition:
             A boolean.
         """
         return predicate(self) or any(t.match_predicate_recursively(predicate) for t in self.inner_types)
+
+
+@lru_cache(1024)
+def _parse_plain_annotation(annotation_id: int, annotation: Any) -> FieldDefinition:
+    """Parse an annotation that is not wrapped in ``Annotated``, ``Required`` etc. and has no extra field attributes.
+
+    The annotation's ``id`` is part of the cache key because equal annotations are not interchangeable, e.g.
+    ``Union[int, str] == Union[str, int]`` while their ``args`` differ in order.
+    """
+    return FieldDefinition._from_annotation(annotation)
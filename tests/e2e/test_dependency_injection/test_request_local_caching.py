@@ -1,3 +1,5 @@
+from itertools import count
+
 from litestar import get
 from litestar.di import Provide
 from litestar.status_codes import HTTP_200_OK
@@ -5,13 +7,10 @@ from litestar.testing import create_test_client
 
 
 def test_caching_per_request() -> None:
-    value = 1
+    counter = count(1)
 
     async def first_dependency() -> int:
-        nonlocal value
-        tmp = value
-        value += 1
-        return tmp
+        return next(counter)
 
     async def second_dependency(first: int) -> int:
         return first + 5
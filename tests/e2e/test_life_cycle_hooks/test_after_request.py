@@ -1,10 +1,10 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 import pytest
 
 from litestar import Controller, Response, Router, get
 from litestar.status_codes import HTTP_200_OK
-from litestar.testing import create_test_client
+from litestar.testing import TestClient, create_test_client
 from litestar.types import AfterRequestHookHandler
 
 
@@ -26,38 +26,49 @@ async def async_after_request_handler_with_hello_world(response: Response[Dict[s
     return response
 
 
+@pytest.fixture(scope="module")
+def after_request_client() -> Iterator[TestClient]:
+    @get("/none")
+    def handler() -> Dict[str, str]:
+        return {"hello": "world"}
+
+    @get("/sync", after_request=sync_after_request_handler)
+    def sync_handler() -> Dict[str, str]:
+        return {"hello": "world"}
+
+    @get("/async", after_request=async_after_request_handler)
+    def async_handler() -> Dict[str, str]:
+        return {"hello": "world"}
+
+    with create_test_client(route_handlers=[handler, sync_handler, async_handler]) as client:
+        yield client
+
+
 @pytest.mark.parametrize(
-    "after_request, expected",
+    "path, expected",
     [
-        [None, {"hello": "world"}],
-        [sync_after_request_handler, {"hello": "moon"}],
-        [async_after_request_handler, {"hello": "moon"}],
+        ["/none", b'{"hello":"world"}'],
+        ["/sync", b'{"hello":"moon"}'],
+        ["/async", b'{"hello":"moon"}'],
     ],
 )
-def test_after_request_handler_called(
-    after_request: Optional[AfterRequestHookHandler], expected: Dict[str, str]
-) -> None:
-    @get(after_request=after_request)
-    def handler() -> Dict[str, str]:
-        return {"hello": "world"}
-
-    with create_test_client(route_handlers=handler) as client:
-        response = client.get("/")
-        assert response.json() == expected
+def test_after_request_handler_called(after_request_client: TestClient, path: str, expected: bytes) -> None:
+    response = after_request_client.get(path)
+    assert response.content == expected
 
 
 @pytest.mark.parametrize(
     "app_after_request_handler, router_after_request_handler, controller_after_request_handler, method_after_request_handler, expected",
     [
-        [None, None, None, None, {"hello": "world"}],
-        [sync_after_request_handler, None, None, None, {"hello": "moon"}],
-        [None, sync_after_request_handler, None, None, {"hello": "moon"}],
-        [None, None, sync_after_request_handler, None, {"hello": "moon"}],
-        [None, None, None, sync_after_request_handler, {"hello": "moon"}],
-        [sync_after_request_handler, async_after_request_handler_with_hello_world, None, None, {"hello": "world"}],
-        [None, sync_after_request_handler, async_after_request_handler_with_hello_world, None, {"hello": "world"}],
-        [None, None, sync_after_request_handler, async_after_request_handler_with_hello_world, {"hello": "world"}],
-        [None, None, None, async_after_request_handler_with_hello_world, {"hello": "world"}],
+        [None, None, None, None, b'{"hello":"world"}'],
+        [sync_after_request_handler, None, None, None, b'{"hello":"moon"}'],
+        [None, sync_after_request_handler, None, None, b'{"hello":"moon"}'],
+        [None, None, sync_after_request_handler, None, b'{"hello":"moon"}'],
+        [None, None, None, sync_after_request_handler, b'{"hello":"moon"}'],
+        [sync_after_request_handler, async_after_request_handler_with_hello_world, None, None, b'{"hello":"world"}'],
+        [None, sync_after_request_handler, async_after_request_handler_with_hello_world, None, b'{"hello":"world"}'],
+        [None, None, sync_after_request_handler, async_after_request_handler_with_hello_world, b'{"hello":"world"}'],
+        [None, None, None, async_after_request_handler_with_hello_world, b'{"hello":"world"}'],
     ],
 )
 def test_after_request_handler_resolution(
@@ -65,7 +76,7 @@ def test_after_request_handler_resolution(
     router_after_request_handler: Optional[AfterRequestHookHandler],
     controller_after_request_handler: Optional[AfterRequestHookHandler],
     method_after_request_handler: Optional[AfterRequestHookHandler],
-    expected: Dict[str, str],
+    expected: bytes,
 ) -> None:
     class MyController(Controller):
         path = "/hello"
@@ -80,7 +91,7 @@ def test_after_request_handler_resolution(
 
     with create_test_client(route_handlers=router, after_request=app_after_request_handler) as client:
         response = client.get("/greetings/hello")
-        assert response.json() == expected
+        assert response.content == expected
 
 
 def test_after_request_handles_handlers_that_return_responses() -> None:
@@ -19,6 +19,7 @@ from litestar.stores.base import Store
 from litestar.stores.memory import MemoryStore
 from litestar.testing import TestClient, create_test_client
 from litestar.types import HTTPScope
+from tests.helpers import unpack_middleware
 
 if TYPE_CHECKING:
     from time_machine import Coordinates
@@ -220,12 +221,9 @@ def test_middleware_not_applied_to_non_cached_routes(
     def handler() -> None: ...
 
     client = create_test_client(route_handlers=[handler])
-    unpacked_middleware = []
-    cur = client.app.asgi_router.root_route_map_node.children["/"].asgi_handlers["GET"][0]
-    while hasattr(cur, "app"):
-        unpacked_middleware.append(cur)
-        cur = cur.app
-    unpacked_middleware.append(cur)
+    unpacked_middleware = unpack_middleware(
+        client.app.asgi_router.root_route_map_node.children["/"].asgi_handlers["GET"][0]
+    )
 
     assert len([m for m in unpacked_middleware if isinstance(m, ResponseCacheMiddleware)]) == int(expect_applied)
 
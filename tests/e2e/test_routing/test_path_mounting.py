@@ -13,6 +13,7 @@ from litestar.testing import create_test_client
 
 if TYPE_CHECKING:
     from litestar.connection import WebSocket
+    from litestar.handlers import BaseRouteHandler
     from litestar.types import Receive, Scope, Send
 
 
@@ -33,7 +34,7 @@ def test_supports_mounting() -> None:
         await response(scope, receive, send)
 
     with create_test_client(
-        route_handlers=[asgi_handler, asgi_handler_mount_path, asgi_handler_not_mounted_path]
+        route_handlers=[asgi_handler, asgi_handler_mount_path, asgi_handler_not_mounted_path], openapi_config=None
     ) as client:
         response = client.get("/base/sub/path")
         assert response.status_code == HTTP_200_OK
@@ -56,45 +57,42 @@ def test_supports_mounting() -> None:
         assert response.text == "/not/mount"
 
 
-def test_supports_sub_routes_below_asgi_handlers() -> None:
-    @asgi("/base/sub/path")
-    async def asgi_handler(scope: "Scope", receive: "Receive", send: "Send") -> None:
-        response = ASGIResponse(body=scope["path"].encode(), media_type=MediaType.TEXT)
-        await response(scope, receive, send)
-
-    @get("/base/sub/path/abc")
-    def regular_handler() -> None:
-        return
-
-    assert Litestar(route_handlers=[asgi_handler, regular_handler])
+@asgi("/base/sub/path")
+async def base_asgi_handler(scope: "Scope", receive: "Receive", send: "Send") -> None:
+    response = ASGIResponse(body=scope["path"].encode(), media_type=MediaType.TEXT)
+    await response(scope, receive, send)
 
 
-def test_does_not_support_asgi_handlers_on_same_level_as_regular_handlers() -> None:
-    @asgi("/base/sub/path")
-    async def asgi_handler(scope: "Scope", receive: "Receive", send: "Send") -> None:
-        response = ASGIResponse(body=scope["path"].encode(), media_type=MediaType.TEXT)
-        await response(scope, receive, send)
+@get("/base/sub/path/abc", sync_to_thread=False)
+def sub_path_handler() -> None:
+    return
 
-    @get("/base/sub/path")
-    def regular_handler() -> None:
-        return
 
-    with pytest.raises(ImproperlyConfiguredException):
-        Litestar(route_handlers=[asgi_handler, regular_handler])
+@get("/base/sub/path", sync_to_thread=False)
+def same_path_handler() -> None:
+    return
 
 
-def test_does_not_support_asgi_handlers_on_same_level_as_websockets() -> None:
-    @asgi("/base/sub/path")
-    async def asgi_handler(scope: "Scope", receive: "Receive", send: "Send") -> None:
-        response = ASGIResponse(body=scope["path"].encode(), media_type=MediaType.TEXT)
-        await response(scope, receive, send)
+@websocket("/base/sub/path")
+async def same_path_websocket_handler(socket: "WebSocket") -> None:
+    return
 
-    @websocket("/base/sub/path")
-    async def regular_handler(socket: "WebSocket") -> None:
-        return
 
-    with pytest.raises(ImproperlyConfiguredException):
-        Litestar(route_handlers=[asgi_handler, regular_handler])
+@pytest.mark.parametrize(
+    "other_handler, should_raise",
+    [
+        (sub_path_handler, False),
+        (same_path_handler, True),
+        (same_path_websocket_handler, True),
+    ],
+    ids=["sub_route_below_asgi", "regular_handler_same_level", "websocket_same_level"],
+)
+def test_asgi_handler_path_conflicts(other_handler: "BaseRouteHandler", should_raise: bool) -> None:
+    if should_raise:
+        with pytest.raises(ImproperlyConfiguredException):
+            Litestar(route_handlers=[base_asgi_handler, other_handler])
+    else:
+        assert Litestar(route_handlers=[base_asgi_handler, other_handler])
 
 
 @pytest.mark.parametrize(
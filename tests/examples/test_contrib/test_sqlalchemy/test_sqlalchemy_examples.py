@@ -1,31 +1,52 @@
-from pathlib import Path
+from typing import AsyncIterator, Iterator
 
 import pytest
+import pytest_asyncio
 from pytest import MonkeyPatch
-from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-from litestar.plugins.sqlalchemy import AsyncSessionConfig, SQLAlchemyAsyncConfig
+from litestar.plugins.sqlalchemy import SQLAlchemyAsyncConfig
 from litestar.testing import TestClient
 
-pytestmark = pytest.mark.xdist_group("sqlalchemy_examples")
+pytestmark = [pytest.mark.xdist_group("sqlalchemy_examples"), pytest.mark.asyncio(loop_scope="session")]
 
 
-async def test_sqlalchemy_declarative_models(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///test.sqlite", poolclass=NullPool)
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def engine() -> AsyncIterator[AsyncEngine]:
+    from docs.examples.contrib.sqlalchemy import sqlalchemy_declarative_models
+
+    # a shared-cache in-memory database lives as long as a connection to it is open, so the pool keeps exactly one
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///file:sqlalchemy_examples?mode=memory&cache=shared&uri=true",
+        connect_args={"uri": True},
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+    )
+
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(sqlalchemy_declarative_models.Author.metadata.create_all)
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def sqlalchemy_config(engine: AsyncEngine) -> Iterator[SQLAlchemyAsyncConfig]:
+    from docs.examples.contrib.sqlalchemy import sqlalchemy_declarative_models
+
+    # the app's plugin and startup hook both use this config, which creates its session maker once and keeps it
+    with MonkeyPatch.context() as mp:
+        mp.setattr(sqlalchemy_declarative_models.sqlalchemy_config, "engine_instance", engine)
+        yield sqlalchemy_declarative_models.sqlalchemy_config
+
 
-    session_config = AsyncSessionConfig(expire_on_commit=False)
-    sqlalchemy_config = SQLAlchemyAsyncConfig(
-        session_config=session_config,
-        create_all=True,
-        engine_instance=engine,
-    )  # Create 'async_session' dependency.
+@pytest.mark.usefixtures("sqlalchemy_config")
+async def test_sqlalchemy_declarative_models() -> None:
     from docs.examples.contrib.sqlalchemy import sqlalchemy_declarative_models
 
-    monkeypatch.setattr(sqlalchemy_declarative_models, "sqlalchemy_config", sqlalchemy_config)
-    async with engine.begin() as connection:
-        await connection.run_sync(sqlalchemy_declarative_models.Author.metadata.create_all)
-        await connection.commit()
     with TestClient(sqlalchemy_declarative_models.app) as client:
         response = client.get("/authors")
         assert response.status_code == 200
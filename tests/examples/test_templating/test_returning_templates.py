@@ -12,12 +12,18 @@ apps_with_expected_responses = [
 ]
 
 
-@pytest.mark.parametrize("app, app_name, file_response, string_response", apps_with_expected_responses)
-@pytest.mark.parametrize("template_type", ["file", "string"])
-def test_returning_templates(app, app_name, file_response, string_response, template_type):
+@pytest.fixture(scope="module", params=apps_with_expected_responses, ids=lambda p: p[1])
+def app_with_expected_responses(request):
+    app, app_name, file_response, string_response = request.param
     with TestClient(app) as client:
-        response = client.get(f"/{template_type}", params={"name": app_name})
-        if template_type == "file":
-            assert response.text.strip() == file_response
-        elif template_type == "string":
-            assert response.text.strip() == string_response
+        yield client, app_name, file_response, string_response
+
+
+@pytest.mark.parametrize("template_type", ["file", "string"])
+def test_returning_templates(app_with_expected_responses, template_type):
+    client, app_name, file_response, string_response = app_with_expected_responses
+    response = client.get(f"/{template_type}", params={"name": app_name})
+    if template_type == "file":
+        assert response.text.strip() == file_response
+    elif template_type == "string":
+        assert response.text.strip() == string_response
@@ -115,6 +115,16 @@ def not_none(val: T | None) -> T:
     return val
 
 
+def unpack_middleware(app: Any) -> list[Any]:
+    """Walk the chain of ASGI apps wrapped by ``app``, outermost first."""
+    unpacked = []
+    cur = app
+    while cur is not None:
+        unpacked.append(cur)
+        cur = getattr(cur, "app", None)
+    return unpacked
+
+
 def purge_module(module_names: list[str], path: str | Path) -> None:
     for name in module_names:
         if name in sys.modules:
@@ -1,4 +1,5 @@
 from typing import Generator, cast
+from weakref import WeakValueDictionary
 
 import pytest
 from _pytest.fixtures import FixtureRequest
@@ -11,9 +12,11 @@ from litestar.dto._backend import DTOBackend
 def reset_cached_dto_backends() -> Generator[None, None, None]:
     DTOBackend._seen_model_names = set()
     AbstractDTO._dto_backends = {}
+    AbstractDTO._narrowed_types = WeakValueDictionary()
     yield
     DTOBackend._seen_model_names = set()
     AbstractDTO._dto_backends = {}
+    AbstractDTO._narrowed_types = WeakValueDictionary()
 
 
 @pytest.fixture(params=[pytest.param(True, id="experimental_backend"), pytest.param(False, id="default_backend")])
@@ -7,7 +7,6 @@ their API.
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Callable, Dict, Generator
-from unittest.mock import patch
 
 import pytest
 
@@ -26,6 +25,7 @@ from litestar.serialization import encode_json, encode_msgpack
 from litestar.static_files.config import StaticFilesConfig
 from litestar.status_codes import HTTP_400_BAD_REQUEST, HTTP_413_REQUEST_ENTITY_TOO_LARGE
 from litestar.testing import TestClient, create_test_client
+from litestar.utils.scope.state import ScopeState
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -43,44 +43,46 @@ def scope_fixture(create_scope: Callable[..., Scope]) -> Scope:
     return create_scope(type="http", route_handler=_route_handler)
 
 
-async def test_request_empty_body_to_json(anyio_backend: str, scope: Scope) -> None:
-    with patch.object(Request, "body", return_value=b""):
-        request_empty_payload: Request[Any, Any, State] = Request(scope=scope)
-        request_json = await request_empty_payload.json()
-        assert request_json is None
-
-
-async def test_request_invalid_body_to_json(anyio_backend: str, scope: Scope) -> None:
-    with patch.object(Request, "body", return_value=b"invalid"), pytest.raises(SerializationException):
-        request_empty_payload: Request[Any, Any, State] = Request(scope=scope)
-        await request_empty_payload.json()
-
-
-async def test_request_valid_body_to_json(anyio_backend: str, scope: Scope) -> None:
-    with patch.object(Request, "body", return_value=b'{"test": "valid"}'):
-        request_empty_payload: Request[Any, Any, State] = Request(scope=scope)
-        request_json = await request_empty_payload.json()
-        assert request_json == {"test": "valid"}
+@pytest.mark.parametrize(
+    "body, should_raise, expected",
+    [
+        (b"", False, None),
+        (b"invalid", True, None),
+        (b'{"test": "valid"}', False, {"test": "valid"}),
+    ],
+    ids=["empty", "invalid", "valid"],
+)
+async def test_request_body_to_json(
+    anyio_backend: str, scope: Scope, body: bytes, should_raise: bool, expected: Any
+) -> None:
+    ScopeState.from_scope(scope).body = body
+    request: Request[Any, Any, State] = Request(scope=scope)
+    if should_raise:
+        with pytest.raises(SerializationException):
+            await request.json()
+    else:
+        assert await request.json() == expected
 
 
 async def test_request_empty_body_to_msgpack(anyio_backend: str, scope: Scope) -> None:
-    with patch.object(Request, "body", return_value=b""):
-        request_empty_payload: Request[Any, Any, State] = Request(scope=scope)
-        request_msgpack = await request_empty_payload.msgpack()
-        assert request_msgpack is None
+    ScopeState.from_scope(scope).body = b""
+    request_empty_payload: Request[Any, Any, State] = Request(scope=scope)
+    request_msgpack = await request_empty_payload.msgpack()
+    assert request_msgpack is None
 
 
 async def test_request_invalid_body_to_msgpack(anyio_backend: str, scope: Scope) -> None:
-    with patch.object(Request, "body", return_value=b"invalid"), pytest.raises(SerializationException):
+    ScopeState.from_scope(scope).body = b"invalid"
+    with pytest.raises(SerializationException):
         request_empty_payload: Request[Any, Any, State] = Request(scope=scope)
         await request_empty_payload.msgpack()
 
 
 async def test_request_valid_body_to_msgpack(anyio_backend: str, scope: Scope) -> None:
-    with patch.object(Request, "body", return_value=encode_msgpack({"test": "valid"})):
-        request_empty_payload: Request[Any, Any, State] = Request(scope=scope)
-        request_msgpack = await request_empty_payload.msgpack()
-        assert request_msgpack == {"test": "valid"}
+    ScopeState.from_scope(scope).body = encode_msgpack({"test": "valid"})
+    request_empty_payload: Request[Any, Any, State] = Request(scope=scope)
+    request_msgpack = await request_empty_payload.msgpack()
+    assert request_msgpack == {"test": "valid"}
 
 
 def test_request_url_for() -> None:
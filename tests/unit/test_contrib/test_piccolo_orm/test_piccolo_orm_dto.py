@@ -17,6 +17,7 @@ except ImportError:
     pytest.skip("Piccolo not installed", allow_module_level=True)
 
 import pytest
+import pytest_asyncio
 from piccolo.columns import Column, column_types
 from piccolo.columns.column_types import Varchar
 from piccolo.conf.apps import Finder
@@ -38,9 +39,12 @@ def test_dto_deprecation() -> None:
         _ = PiccoloDTO[Manager]
 
 
-@pytest.fixture(autouse=True)
+@pytest_asyncio.fixture(autouse=True, scope="module", loop_scope="module")
 async def scaffold_piccolo() -> AsyncGenerator:
-    """Scaffolds Piccolo ORM and performs cleanup."""
+    """Scaffolds Piccolo ORM once per module and performs cleanup.
+
+    None of the tests persist rows, so the tables do not need to be recreated between tests.
+    """
     tables = Finder().get_table_classes()
     await drop_db_tables(*tables)
     await create_db_tables(*tables)
@@ -18,6 +18,9 @@ from . import Model
 
 T = TypeVar("T", bound=Model)
 
+_MODEL = Model(a=1, b="2")
+_ENCODED_MODEL = b'{"a": 1, "b": "2"}'
+
 
 @pytest.fixture
 def ModelDataDTO(use_experimental_dto_backend: bool) -> type[AbstractDTO]:
@@ -25,13 +28,13 @@ def ModelDataDTO(use_experimental_dto_backend: bool) -> type[AbstractDTO]:
         config = DTOConfig(experimental_codegen_backend=use_experimental_dto_backend)
 
         def decode_builtins(self, value: Any) -> Model:
-            return Model(a=1, b="2")
+            return _MODEL
 
         def decode_bytes(self, value: bytes) -> Model:
-            return Model(a=1, b="2")
+            return _MODEL
 
         def data_to_encodable_type(self, data: Model | Collection[Model]) -> bytes | LitestarEncodableType:
-            return Model(a=1, b="2")
+            return _MODEL
 
         @classmethod
         def create_openapi_schema(
@@ -66,7 +69,7 @@ def ModelReturnDTO() -> type[AbstractDTO]:
             raise RuntimeError("Return DTO should not have this method called")
 
         def data_to_encodable_type(self, data: Model | Collection[Model]) -> bytes | LitestarEncodableType:
-            return b'{"a": 1, "b": "2"}'
+            return _ENCODED_MODEL
 
         @classmethod
         def create_openapi_schema(
@@ -7,3 +7,10 @@ from litestar.exceptions import ImproperlyConfiguredException
 def test_include_and_exclude_raises() -> None:
     with pytest.raises(ImproperlyConfiguredException):
         DTOConfig(include={"a"}, exclude={"b"})
+
+
+def test_include_and_exclude_are_frozen() -> None:
+    config = DTOConfig(exclude={"a", "b"})
+    assert config.exclude == frozenset({"a", "b"})
+    assert isinstance(config.exclude, frozenset)
+    assert isinstance(config.include, frozenset)
@@ -2,17 +2,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from types import ModuleType
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, cast
 from unittest.mock import MagicMock
 
 import pytest
-from msgspec import Meta, Struct, to_builtins
+from _pytest.fixtures import FixtureRequest
+from msgspec import Meta, Struct, convert
 
 from litestar import Litestar, Request, get, post
 from litestar._openapi.schema_generation import SchemaCreator
 from litestar.dto import DataclassDTO, DTOConfig, DTOField
 from litestar.dto._backend import DTOBackend, _create_struct_field_meta_for_field_definition
+from litestar.dto._codegen_backend import DTOCodegenBackend
 from litestar.dto._types import CollectionType, SimpleType, TransferDTOFieldDefinition
 from litestar.dto.data_structures import DTOFieldDefinition
 from litestar.enums import MediaType
@@ -57,9 +58,6 @@ DESTRUCTURED = {
     "integer": 1,
     "optional": None,
 }
-RAW = b'{"a":1,"nested":{"a":1,"b":"two"},"nested_list":[{"a":1,"b":"two"}],"nested_mapping":{"a":{"a":1,"b":"two"}},"integer":1,"b":"b","c":[],"optional":null}'
-MSGPACK_RAW = b"\x88\xa1a\x01\xa6nested\x82\xa1a\x01\xa1b\xa3two\xabnested_list\x91\x82\xa1a\x01\xa1b\xa3two\xaenested_mapping\x81\xa1a\x82\xa1a\x01\xa1b\xa3two\xa7integer\x01\xa1b\xa1b\xa1c\x90\xa8optional\xc0"
-COLLECTION_RAW = b'[{"a":1,"nested":{"a":1,"b":"two"},"nested_list":[{"a":1,"b":"two"}],"nested_mapping":{"a":{"a":1,"b":"two"}},"integer":1,"b":"b","c":[],"optional":null}]'
 STRUCTURED = DC(
     a=1,
     b="b",
@@ -70,9 +68,56 @@ STRUCTURED = DC(
     optional=None,
     integer=1,
 )
+RAW = b'{"a":1,"nested":{"a":1,"b":"two"},"nested_list":[{"a":1,"b":"two"}],"nested_mapping":{"a":{"a":1,"b":"two"}},"integer":1,"b":"b","c":[],"optional":null}'
+MSGPACK_RAW = b"\x88\xa1a\x01\xa6nested\x82\xa1a\x01\xa1b\xa3two\xabnested_list\x91\x82\xa1a\x01\xa1b\xa3two\xaenested_mapping\x81\xa1a\x82\xa1a\x01\xa1b\xa3two\xa7integer\x01\xa1b\xa1b\xa1c\x90\xa8optional\xc0"
+COLLECTION_RAW = b'[{"a":1,"nested":{"a":1,"b":"two"},"nested_list":[{"a":1,"b":"two"}],"nested_mapping":{"a":{"a":1,"b":"two"}},"integer":1,"b":"b","c":[],"optional":null}]'
+DC_FIELD_DEFINITION = FieldDefinition.from_annotation(DC)
+DC_LIST_FIELD_DEFINITION = FieldDefinition.from_annotation(List[DC])
+SOME_MODEL_FIELDS = (
+    TransferDTOFieldDefinition.from_dto_field_definition(
+        field_definition=DTOFieldDefinition.from_field_definition(
+            field_definition=FieldDefinition.from_kwarg(annotation=int, name="a"),
+            default_factory=None,
+            dto_field=DTOField(),
+            model_name="some_module.SomeModel",
+        ),
+        serialization_name="a",
+        transfer_type=SimpleType(field_definition=FieldDefinition.from_annotation(int), nested_field_info=None),
+        is_partial=False,
+        is_excluded=False,
+    ),
+)
 
 
-@pytest.fixture(name="dto_factory")
+def create_backend(
+    backend_cls: type[DTOBackend], dto_factory: type[DataclassDTO], field_definition: FieldDefinition
+) -> DTOBackend:
+    return backend_cls(
+        handler_id="test",
+        dto_factory=dto_factory,
+        field_definition=field_definition,
+        model_type=DC,
+        wrapper_attribute_name=None,
+        is_data_field=True,
+    )
+
+
+# module scoped overrides, so that the backends built from them are shared by the tests of this module only
+@pytest.fixture(
+    name="use_experimental_dto_backend",
+    scope="module",
+    params=[pytest.param(True, id="experimental_backend"), pytest.param(False, id="default_backend")],
+)
+def fx_use_experimental_dto_backend(request: FixtureRequest) -> bool:
+    return cast(bool, request.param)
+
+
+@pytest.fixture(name="backend_cls", scope="module")
+def fx_backend_cls(use_experimental_dto_backend: bool) -> type[DTOBackend | DTOCodegenBackend]:
+    return DTOCodegenBackend if use_experimental_dto_backend else DTOBackend
+
+
+@pytest.fixture(name="dto_factory", scope="module")
 def fx_backend_factory(use_experimental_dto_backend: bool) -> type[DataclassDTO]:
     class Factory(DataclassDTO):
         config = DTOConfig(experimental_codegen_backend=use_experimental_dto_backend)
@@ -81,7 +126,36 @@ def fx_backend_factory(use_experimental_dto_backend: bool) -> type[DataclassDTO]
     return Factory
 
 
-@pytest.fixture(name="asgi_connection")
+@pytest.fixture(name="backend", scope="module")
+def fx_backend(dto_factory: type[DataclassDTO], backend_cls: type[DTOBackend]) -> DTOBackend:
+    return create_backend(backend_cls, dto_factory, DC_FIELD_DEFINITION)
+
+
+@pytest.fixture(name="collection_backend", scope="module")
+def fx_collection_backend(dto_factory: type[DataclassDTO], backend_cls: type[DTOBackend]) -> DTOBackend:
+    return create_backend(backend_cls, dto_factory, DC_LIST_FIELD_DEFINITION)
+
+
+def get_transfer_field(
+    field_definitions: tuple[TransferDTOFieldDefinition, ...], path: str
+) -> TransferDTOFieldDefinition:
+    """Resolve a dotted config path, such as ``"b.d.0.e"``, to the parsed field definition it addresses."""
+    transfer_type: Any = None
+    for name in path.split("."):
+        if isinstance(transfer_type, CollectionType):
+            # collection items are addressed by index
+            transfer_type = transfer_type.inner_type
+            continue
+        if transfer_type is not None:
+            assert isinstance(transfer_type, SimpleType)
+            assert transfer_type.nested_field_info is not None
+            field_definitions = transfer_type.nested_field_info.field_definitions
+        field_definition = next(f for f in field_definitions if f.name == name)
+        transfer_type = field_definition.transfer_type
+    return field_definition
+
+
+@pytest.fixture(name="asgi_connection", scope="module")
 def fx_asgi_connection() -> Request[Any, Any, Any]:
     @get("/", name="handler_id", media_type=MediaType.JSON)
     def _handler() -> None: ...
@@ -89,70 +163,40 @@ def fx_asgi_connection() -> Request[Any, Any, Any]:
     return RequestFactory().get(path="/", route_handler=_handler)
 
 
-def test_backend_parse_raw_json(
-    dto_factory: type[DataclassDTO], asgi_connection: Request[Any, Any, Any], backend_cls: type[DTOBackend]
-) -> None:
-    assert (
-        to_builtins(
-            backend_cls(
-                dto_factory=dto_factory,
-                field_definition=FieldDefinition.from_annotation(DC),
-                model_type=DC,
-                wrapper_attribute_name=None,
-                is_data_field=True,
-                handler_id="test",
-            ).parse_raw(RAW, asgi_connection)
-        )
-        == DESTRUCTURED
-    )
-
-
-def test_backend_parse_raw_msgpack(dto_factory: type[DataclassDTO], backend_cls: type[DTOBackend]) -> None:
-    @get("/", name="handler_id", media_type=MediaType.MESSAGEPACK)
+@pytest.mark.parametrize(
+    "media_type, raw",
+    [(MediaType.JSON, RAW), (MediaType.MESSAGEPACK, MSGPACK_RAW)],
+    ids=["json", "msgpack"],
+)
+def test_backend_parse_raw(backend: DTOBackend, media_type: MediaType, raw: bytes) -> None:
+    @get("/", name="handler_id", media_type=media_type)
     def _handler() -> None: ...
 
-    asgi_connection = RequestFactory().get(
-        path="/", route_handler=_handler, headers={"Content-Type": MediaType.MESSAGEPACK}
-    )
-    assert (
-        to_builtins(
-            backend_cls(
-                dto_factory=dto_factory,
-                field_definition=FieldDefinition.from_annotation(DC),
-                model_type=DC,
-                wrapper_attribute_name=None,
-                is_data_field=True,
-                handler_id="test",
-            ).parse_raw(MSGPACK_RAW, asgi_connection)
-        )
-        == DESTRUCTURED
-    )
+    asgi_connection = RequestFactory().get(path="/", route_handler=_handler, headers={"Content-Type": media_type})
+    assert backend.parse_raw(raw, asgi_connection) == convert(DESTRUCTURED, type=backend.annotation)
 
 
-def test_backend_parse_unsupported_media_type(
-    dto_factory: type[DataclassDTO], asgi_connection: Request[Any, Any, Any], backend_cls: type[DTOBackend]
-) -> None:
+def test_backend_parse_unsupported_media_type(backend: DTOBackend) -> None:
     @get("/", name="handler_id", media_type="text/css")
     def _handler() -> None: ...
 
     asgi_connection = RequestFactory().get(path="/", route_handler=_handler, headers={"Content-Type": "text/css"})
 
     with pytest.raises(SerializationException):
-        backend_cls(
-            dto_factory=dto_factory,
-            field_definition=FieldDefinition.from_annotation(DC),
-            model_type=DC,
-            wrapper_attribute_name=None,
-            is_data_field=True,
-            handler_id="test",
-        ).parse_raw(b"", asgi_connection)
+        backend.parse_raw(b"", asgi_connection)
+
+
+def test_backend_decoders_are_reused(backend: DTOBackend) -> None:
+    json_decoder = backend._get_decoder(is_msgpack=False, type_decoders=[])
+    assert backend._get_decoder(is_msgpack=False, type_decoders=[]) is json_decoder
+    assert backend._get_decoder(is_msgpack=True, type_decoders=[]) is not json_decoder
 
 
 def test_backend_iterable_annotation(dto_factory: type[DataclassDTO], backend_cls: type[DTOBackend]) -> None:
     backend = DTOBackend(
         handler_id="test",
         dto_factory=dto_factory,
-        field_definition=FieldDefinition.from_annotation(List[DC]),
+        field_definition=DC_LIST_FIELD_DEFINITION,
         model_type=DC,
         wrapper_attribute_name=None,
         is_data_field=True,
@@ -162,29 +206,11 @@ def test_backend_iterable_annotation(dto_factory: type[DataclassDTO], backend_cl
     assert field_definition.has_inner_subclass_of(Struct)
 
 
-def test_backend_scalar_annotation(dto_factory: type[DataclassDTO], backend_cls: type[DTOBackend]) -> None:
-    backend = backend_cls(
-        handler_id="test",
-        dto_factory=dto_factory,
-        field_definition=FieldDefinition.from_annotation(DC),
-        model_type=DC,
-        wrapper_attribute_name=None,
-        is_data_field=True,
-    )
+def test_backend_scalar_annotation(backend: DTOBackend) -> None:
     assert FieldDefinition.from_annotation(backend.annotation).is_subclass_of(Struct)
 
 
-def test_backend_populate_data_from_builtins(
-    dto_factory: type[DataclassDTO], asgi_connection: Request[Any, Any, Any], backend_cls: type[DTOBackend]
-) -> None:
-    backend = backend_cls(
-        handler_id="test",
-        dto_factory=dto_factory,
-        field_definition=FieldDefinition.from_annotation(DC),
-        model_type=DC,
-        wrapper_attribute_name=None,
-        is_data_field=True,
-    )
+def test_backend_populate_data_from_builtins(backend: DTOBackend, asgi_connection: Request[Any, Any, Any]) -> None:
     data = backend.populate_data_from_builtins(builtins=DESTRUCTURED, asgi_connection=asgi_connection)
     assert data == STRUCTURED
 
@@ -199,7 +225,7 @@ def test_backend_create_openapi_schema(dto_factory: type[DataclassDTO]) -> None:
     creator = SchemaCreator(plugins=app.plugins.openapi)
     ref = dto_factory.create_openapi_schema(
         handler_id=app.get_handler_index_by_name("test")["handler"].handler_id,  # type: ignore[index]
-        field_definition=FieldDefinition.from_annotation(DC),
+        field_definition=DC_FIELD_DEFINITION,
         schema_creator=creator,
     )
     schemas = creator.schema_registry.generate_components_schemas()
@@ -231,92 +257,59 @@ def test_backend_model_name_uniqueness(dto_factory: type[DataclassDTO], backend_
     backend = backend_cls(
         handler_id="test",
         dto_factory=dto_factory,
-        field_definition=FieldDefinition.from_annotation(DC),
+        field_definition=DC_FIELD_DEFINITION,
         model_type=DC,
         wrapper_attribute_name=None,
         is_data_field=True,
     )
     backend._seen_model_names.clear()
-    unique_names: set = set()
 
-    field_definition = TransferDTOFieldDefinition.from_dto_field_definition(
-        field_definition=DTOFieldDefinition.from_field_definition(
-            field_definition=FieldDefinition.from_kwarg(annotation=int, name="a"),
-            default_factory=None,
-            dto_field=DTOField(),
-            model_name="some_module.SomeModel",
-        ),
-        serialization_name="a",
-        transfer_type=SimpleType(field_definition=FieldDefinition.from_annotation(int), nested_field_info=None),
-        is_partial=False,
-        is_excluded=False,
-    )
+    names = [
+        backend.create_transfer_model_type("some_module.SomeModel", field_definitions=SOME_MODEL_FIELDS).__name__
+        for _ in range(100)
+    ]
 
-    for _ in range(100):
-        model_class = backend.create_transfer_model_type("some_module.SomeModel", field_definitions=(field_definition,))
-        unique_names.add(model_class.__name__)
+    assert len(set(names)) == len(names) == 100
+    assert backend._seen_model_names == set(names)
 
-    assert len(unique_names) == 100
-    assert backend._seen_model_names == unique_names
 
-
-def test_backend_populate_data_from_raw(
-    dto_factory: type[DataclassDTO], asgi_connection: Request[Any, Any, Any], backend_cls: type[DTOBackend]
+def test_backend_model_field_definitions_are_generated_once(
+    dto_factory: type[DataclassDTO], backend_cls: type[DTOBackend]
 ) -> None:
-    backend = backend_cls(
-        handler_id="test",
-        dto_factory=dto_factory,
-        field_definition=FieldDefinition.from_annotation(DC),
-        model_type=DC,
-        wrapper_attribute_name=None,
-        is_data_field=True,
-    )
+    backends = [
+        backend_cls(
+            handler_id="test",
+            dto_factory=dto_factory,
+            field_definition=DC_FIELD_DEFINITION,
+            model_type=DC,
+            wrapper_attribute_name=None,
+            is_data_field=is_data_field,
+        )
+        for is_data_field in (True, False)
+    ]
+    data_backend, return_backend = backends
+    assert data_backend._get_model_field_definitions(DC) is return_backend._get_model_field_definitions(DC)
+
+
+def test_backend_populate_data_from_raw(backend: DTOBackend, asgi_connection: Request[Any, Any, Any]) -> None:
     data = backend.populate_data_from_raw(RAW, asgi_connection)
     assert data == STRUCTURED
 
 
 def test_backend_populate_collection_data_from_raw(
-    dto_factory: type[DataclassDTO], asgi_connection: Request[Any, Any, Any], backend_cls: type[DTOBackend]
+    collection_backend: DTOBackend, asgi_connection: Request[Any, Any, Any]
 ) -> None:
-    backend = backend_cls(
-        handler_id="test",
-        dto_factory=dto_factory,
-        field_definition=FieldDefinition.from_annotation(List[DC]),
-        model_type=DC,
-        wrapper_attribute_name=None,
-        is_data_field=True,
-    )
-    data = backend.populate_data_from_raw(COLLECTION_RAW, asgi_connection)
+    data = collection_backend.populate_data_from_raw(COLLECTION_RAW, asgi_connection)
     assert data == [STRUCTURED]
 
 
-def test_backend_encode_data(
-    dto_factory: type[DataclassDTO], asgi_connection: Request[Any, Any, Any], backend_cls: type[DTOBackend]
-) -> None:
-    backend = backend_cls(
-        handler_id="test",
-        dto_factory=dto_factory,
-        field_definition=FieldDefinition.from_annotation(DC),
-        model_type=DC,
-        wrapper_attribute_name=None,
-        is_data_field=True,
-    )
+def test_backend_encode_data(backend: DTOBackend) -> None:
     data = backend.encode_data(STRUCTURED)
     assert encode_json(data) == RAW
 
 
-def test_backend_encode_collection_data(
-    dto_factory: type[DataclassDTO], asgi_connection: Request[Any, Any, Any], backend_cls: type[DTOBackend]
-) -> None:
-    backend = backend_cls(
-        handler_id="test",
-        dto_factory=dto_factory,
-        field_definition=FieldDefinition.from_annotation(List[DC]),
-        model_type=DC,
-        wrapper_attribute_name=None,
-        is_data_field=True,
-    )
-    data = backend.encode_data([STRUCTURED])
+def test_backend_encode_collection_data(collection_backend: DTOBackend) -> None:
+    data = collection_backend.encode_data([STRUCTURED])
     assert encode_json(data) == COLLECTION_RAW
 
 
@@ -351,116 +344,54 @@ def test_transfer_only_touches_included_attributes(backend_cls: type[DTOBackend]
     assert mock.call_count == 0
 
 
-def test_parse_model_nested_exclude(create_module: Callable[[str], ModuleType], backend_cls: type[DTOBackend]) -> None:
-    module = create_module(
-        """
-from dataclasses import dataclass
-from typing import List
-
-from litestar.dto import DataclassDTO
-
 @dataclass
 class NestedNestedModel:
     e: int
     f: int
 
-@dataclass
-class NestedModel:
-    c: int
-    d: List[NestedNestedModel]
-
-@dataclass
-class Model:
-    a: int
-    b: NestedModel
-
-dto_type = DataclassDTO[Model]
-    """
-    )
-
-    class Factory(DataclassDTO):
-        config = DTOConfig(max_nested_depth=2, exclude={"a", "b.c", "b.d.0.e"})
-
-    backend = backend_cls(
-        handler_id="test",
-        dto_factory=Factory,
-        field_definition=FieldDefinition.from_annotation(module.Model),
-        model_type=module.Model,
-        wrapper_attribute_name=None,
-        is_data_field=True,
-    )
-    parsed = backend.parsed_field_definitions
-    assert next(f for f in parsed if f.name == "a").is_excluded
-    assert parsed[1].name == "b"
-    b_transfer_type = parsed[1].transfer_type
-    assert isinstance(b_transfer_type, SimpleType)
-    b_nested_info = b_transfer_type.nested_field_info
-    assert b_nested_info is not None
-    assert next(f for f in b_nested_info.field_definitions if f.name == "c").is_excluded
-    assert b_nested_info.field_definitions[1].name == "d"
-    b_d_transfer_type = b_nested_info.field_definitions[1].transfer_type
-    assert isinstance(b_d_transfer_type, CollectionType)
-    assert isinstance(b_d_transfer_type.inner_type, SimpleType)
-    b_d_nested_info = b_d_transfer_type.inner_type.nested_field_info
-    assert b_d_nested_info is not None
-    assert next(f for f in b_d_nested_info.field_definitions if f.name == "e").is_excluded
-    assert b_d_nested_info.field_definitions[1].name == "f"
-
-
-def test_parse_model_nested_include(create_module: Callable[[str], ModuleType], backend_cls: type[DTOBackend]) -> None:
-    module = create_module(
-        """
-from dataclasses import dataclass
-from typing import List
-
-from litestar.dto import DataclassDTO
-
-@dataclass
-class NestedNestedModel:
-    e: int
-    f: int
 
 @dataclass
 class NestedModel:
     c: int
     d: List[NestedNestedModel]
 
+
 @dataclass
 class Model:
     a: int
     b: NestedModel
 
-dto_type = DataclassDTO[Model]
-    """
-    )
 
+@pytest.mark.parametrize(
+    "config_kwargs, expect_excluded",
+    [
+        ({"exclude": {"a", "b.c", "b.d.0.e"}}, True),
+        ({"include": {"a", "b.c", "b.d.0.e"}}, False),
+    ],
+    ids=["exclude", "include"],
+)
+def test_parse_model_nested_include_exclude(
+    config_kwargs: dict[str, Any], expect_excluded: bool, backend_cls: type[DTOBackend]
+) -> None:
     class Factory(DataclassDTO):
-        config = DTOConfig(max_nested_depth=2, include={"a", "b.c", "b.d.0.e"})
+        config = DTOConfig(max_nested_depth=2, **config_kwargs)
 
     backend = backend_cls(
         handler_id="test",
         dto_factory=Factory,
-        field_definition=FieldDefinition.from_annotation(module.Model),
-        model_type=module.Model,
+        field_definition=FieldDefinition.from_annotation(Model),
+        model_type=Model,
         wrapper_attribute_name=None,
         is_data_field=True,
     )
     parsed = backend.parsed_field_definitions
-    assert not next(f for f in parsed if f.name == "a").is_excluded
-    assert parsed[1].name == "b"
-    b_transfer_type = parsed[1].transfer_type
-    assert isinstance(b_transfer_type, SimpleType)
-    b_nested_info = b_transfer_type.nested_field_info
-    assert b_nested_info is not None
-    assert not next(f for f in b_nested_info.field_definitions if f.name == "c").is_excluded
-    assert b_nested_info.field_definitions[1].name == "d"
-    b_d_transfer_type = b_nested_info.field_definitions[1].transfer_type
-    assert isinstance(b_d_transfer_type, CollectionType)
-    assert isinstance(b_d_transfer_type.inner_type, SimpleType)
-    b_d_nested_info = b_d_transfer_type.inner_type.nested_field_info
-    assert b_d_nested_info is not None
-    assert not next(f for f in b_d_nested_info.field_definitions if f.name == "e").is_excluded
-    assert b_d_nested_info.field_definitions[1].name == "f"
+    for path in ("a", "b.c", "b.d.0.e"):
+        assert get_transfer_field(parsed, path).is_excluded is expect_excluded
+    # fields that are not named in the config keep the opposite state
+    assert get_transfer_field(parsed, "b.d.0.f").is_excluded is not expect_excluded
+    # parents of named nested fields stay included either way
+    for path in ("b", "b.d"):
+        assert not get_transfer_field(parsed, path).is_excluded
 
 
 @pytest.mark.parametrize(
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import dataclasses
+import gc
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Generic, Tuple, TypeVar, Union
+from typing import TYPE_CHECKING, Generic, List, Tuple, TypeVar, Union
 
 import pytest
 from typing_extensions import Annotated
@@ -22,6 +23,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound=Model)
 
+MODEL_DATA_FIELD_DEFINITION = FieldDefinition.from_kwarg(Model, name="data")
+
 
 def get_backend(dto_type: type[DataclassDTO[Any]]) -> DTOBackend:
     value = next(iter(dto_type._dto_backends.values()))
@@ -46,6 +49,28 @@ def test_type_narrowing_with_scalar_type_arg() -> None:
     assert dto.model_type is Model  # type: ignore[misc]
 
 
+def test_type_narrowing_is_cached() -> None:
+    assert DataclassDTO[Model] is DataclassDTO[Model]
+    assert DataclassDTO[Model] is not DataclassDTO[List[Model]]
+
+
+def test_type_narrowing_cache_is_keyed_on_annotation_identity() -> None:
+    annotation = List[Model]
+    equal_annotation = annotation.copy_with((Model,))  # type: ignore[attr-defined]
+    assert equal_annotation == annotation
+    assert equal_annotation is not annotation
+    assert DataclassDTO[annotation] is not DataclassDTO[equal_annotation]  # type: ignore[valid-type]
+
+
+def test_unreferenced_narrowed_types_are_released() -> None:
+    dto_type = DataclassDTO[Model]
+    assert (DataclassDTO, id(Model), Model) in DataclassDTO._narrowed_types
+
+    del dto_type
+    gc.collect()
+    assert (DataclassDTO, id(Model), Model) not in DataclassDTO._narrowed_types
+
+
 def test_type_narrowing_with_annotated_scalar_type_arg() -> None:
     config = DTOConfig()
     dto = DataclassDTO[Annotated[Model, config]]
@@ -103,7 +128,7 @@ def test_config_assigned_via_subclassing() -> None:
 async def test_from_bytes(asgi_connection: Request[Any, Any, Any]) -> None:
     dto_type = DataclassDTO[Model]
     dto_type.create_for_field_definition(
-        FieldDefinition.from_kwarg(Model, name="data"), handler_id=asgi_connection.route_handler.handler_id
+        MODEL_DATA_FIELD_DEFINITION, handler_id=asgi_connection.route_handler.handler_id
     )
     assert dto_type(asgi_connection).decode_bytes(b'{"a":1,"b":"two"}') == Model(a=1, b="two")
 
@@ -112,7 +137,7 @@ def test_config_field_rename(asgi_connection: Request[Any, Any, Any]) -> None:
     config = DTOConfig(rename_fields={"a": "z"})
     DataclassDTO._dto_backends = {}
     dto_type = DataclassDTO[Annotated[Model, config]]
-    dto_type.create_for_field_definition(FieldDefinition.from_kwarg(Model, name="data"), handler_id="handler_id")
+    dto_type.create_for_field_definition(MODEL_DATA_FIELD_DEFINITION, handler_id="handler_id")
     field_definitions = dto_type._dto_backends["handler_id"]["data_backend"].parsed_field_definitions  # pyright: ignore
     assert field_definitions[0].serialization_name == "z"
 
@@ -1,6 +1,6 @@
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import Any, AsyncGenerator, Dict, List, Optional, Type, Union, cast
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Type, Union, cast
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -65,43 +65,61 @@ def test_basic_listener(mock: MagicMock, listener: Union[websocket_listener, Typ
     mock.assert_any_call("bar")
 
 
-@pytest.mark.parametrize("receive_mode", ["text", "binary"])
-def test_listener_receive_bytes(receive_mode: WebSocketMode, mock: MagicMock) -> None:
-    @websocket_listener("/", receive_mode=receive_mode)
-    def handler(data: bytes) -> None:
+websocket_modes: Tuple[WebSocketMode, ...] = ("text", "binary")
+
+
+def test_listener_receive_bytes(mock: MagicMock) -> None:
+    @websocket_listener("/text", receive_mode="text")
+    def text_handler(data: bytes) -> None:
         mock(data)
 
-    client = create_test_client([handler])
-    with client.websocket_connect("/") as ws:
-        ws.send("foo", mode=receive_mode)
+    @websocket_listener("/binary", receive_mode="binary")
+    def binary_handler(data: bytes) -> None:
+        mock(data)
 
-    mock.assert_called_once_with(b"foo")
+    client = create_test_client([text_handler, binary_handler])
+    for receive_mode in websocket_modes:
+        with client.websocket_connect(f"/{receive_mode}") as ws:
+            ws.send("foo", mode=receive_mode)
 
+        mock.assert_called_once_with(b"foo")
+        mock.reset_mock()
 
-@pytest.mark.parametrize("receive_mode", ["text", "binary"])
-def test_listener_receive_string(receive_mode: WebSocketMode, mock: MagicMock) -> None:
-    @websocket_listener("/", receive_mode=receive_mode)
-    def handler(data: str) -> None:
+
+def test_listener_receive_string(mock: MagicMock) -> None:
+    @websocket_listener("/text", receive_mode="text")
+    def text_handler(data: str) -> None:
         mock(data)
 
-    client = create_test_client([handler])
-    with client.websocket_connect("/") as ws:
-        ws.send("foo", mode=receive_mode)
+    @websocket_listener("/binary", receive_mode="binary")
+    def binary_handler(data: str) -> None:
+        mock(data)
 
-    mock.assert_called_once_with("foo")
+    client = create_test_client([text_handler, binary_handler])
+    for receive_mode in websocket_modes:
+        with client.websocket_connect(f"/{receive_mode}") as ws:
+            ws.send("foo", mode=receive_mode)
 
+        mock.assert_called_once_with("foo")
+        mock.reset_mock()
 
-@pytest.mark.parametrize("receive_mode", ["text", "binary"])
-def test_listener_receive_json(receive_mode: WebSocketMode, mock: MagicMock) -> None:
-    @websocket_listener("/", receive_mode=receive_mode)
-    def handler(data: List[str]) -> None:
+
+def test_listener_receive_json(mock: MagicMock) -> None:
+    @websocket_listener("/text", receive_mode="text")
+    def text_handler(data: List[str]) -> None:
         mock(data)
 
-    client = create_test_client([handler])
-    with client.websocket_connect("/") as ws:
-        ws.send_json(["foo", "bar"], mode=receive_mode)
+    @websocket_listener("/binary", receive_mode="binary")
+    def binary_handler(data: List[str]) -> None:
+        mock(data)
+
+    client = create_test_client([text_handler, binary_handler])
+    for receive_mode in websocket_modes:
+        with client.websocket_connect(f"/{receive_mode}") as ws:
+            ws.send_json(["foo", "bar"], mode=receive_mode)
 
-    mock.assert_called_once_with(["foo", "bar"])
+        mock.assert_called_once_with(["foo", "bar"])
+        mock.reset_mock()
 
 
 @dataclass
@@ -129,31 +147,39 @@ def test_listener_receive_with_dto(receive_mode: WebSocketMode) -> None:
     assert value.hidden == "super secret"
 
 
-@pytest.mark.parametrize("send_mode", ["text", "binary"])
-def test_listener_return_bytes(send_mode: WebSocketMode) -> None:
-    @websocket_listener("/", send_mode=send_mode)
-    def handler(data: str) -> bytes:
+def test_listener_return_bytes() -> None:
+    @websocket_listener("/text", send_mode="text")
+    def text_handler(data: str) -> bytes:
         return data.encode("utf-8")
 
-    client = create_test_client([handler])
-    with client.websocket_connect("/") as ws:
+    @websocket_listener("/binary", send_mode="binary")
+    def binary_handler(data: str) -> bytes:
+        return data.encode("utf-8")
+
+    client = create_test_client([text_handler, binary_handler])
+    with client.websocket_connect("/text") as ws:
+        ws.send_text("foo")
+        assert ws.receive_text() == "foo"
+
+    with client.websocket_connect("/binary") as ws:
         ws.send_text("foo")
-        if send_mode == "text":
-            assert ws.receive_text() == "foo"
-        else:
-            assert ws.receive_bytes() == b"foo"
+        assert ws.receive_bytes() == b"foo"
 
 
-@pytest.mark.parametrize("send_mode", ["text", "binary"])
-def test_listener_send_json(send_mode: WebSocketMode) -> None:
-    @websocket_listener("/", send_mode=send_mode)
-    def handler(data: str) -> Dict[str, str]:
+def test_listener_send_json() -> None:
+    @websocket_listener("/text", send_mode="text")
+    def text_handler(data: str) -> Dict[str, str]:
         return {"data": data}
 
-    client = create_test_client([handler])
-    with client.websocket_connect("/") as ws:
-        ws.send_text("foo")
-        assert ws.receive_json(mode=send_mode) == {"data": "foo"}
+    @websocket_listener("/binary", send_mode="binary")
+    def binary_handler(data: str) -> Dict[str, str]:
+        return {"data": data}
+
+    client = create_test_client([text_handler, binary_handler])
+    for send_mode in websocket_modes:
+        with client.websocket_connect(f"/{send_mode}") as ws:
+            ws.send_text("foo")
+            assert ws.receive_json(mode=send_mode) == {"data": "foo"}
 
 
 @pytest.mark.parametrize("send_mode", ["text", "binary"])
@@ -1,4 +1,4 @@
-from typing import List, Set
+from typing import List, Set, Tuple
 
 import pytest
 
@@ -21,9 +21,8 @@ DEPENDENCY_C2 = Dependency("C2", Provide(dummy), [DEPENDENCY_C1])
 DEPENDENCY_ALL_EXCEPT_A = Dependency("D", Provide(dummy), [DEPENDENCY_B, DEPENDENCY_C1, DEPENDENCY_C2])
 
 
-@pytest.mark.parametrize(
-    "dependency_tree,expected_batches",
-    [
+def test_dependency_batches() -> None:
+    cases: List[Tuple[Set[Dependency], List[Set[Dependency]]]] = [
         (set(), []),
         ({DEPENDENCY_A}, [{DEPENDENCY_A}]),
         (
@@ -55,11 +54,11 @@ DEPENDENCY_ALL_EXCEPT_A = Dependency("D", Provide(dummy), [DEPENDENCY_B, DEPENDE
                 {DEPENDENCY_ALL_EXCEPT_A},
             ],
         ),
-    ],
-)
-def test_dependency_batches(dependency_tree: Set[Dependency], expected_batches: List[Set[Dependency]]) -> None:
-    calculated_batches = create_dependency_batches(dependency_tree)
-    assert calculated_batches == expected_batches
+    ]
+
+    for i, (dependency_tree, expected_batches) in enumerate(cases):
+        calculated_batches = create_dependency_batches(dependency_tree)
+        assert calculated_batches == expected_batches, f"case {i}"
 
 
 @pytest.mark.parametrize(
@@ -64,56 +64,77 @@ def test_application_state_injection(state_typing: Type[State]) -> None:
 
 
 person_instance = DataclassPersonFactory.build()
+people = DataclassPersonFactory.batch(size=5)
 
+data_methods = [
+    (HttpMethod.POST, HTTP_201_CREATED),
+    (HttpMethod.PUT, HTTP_200_OK),
+    (HttpMethod.PATCH, HTTP_200_OK),
+    (HttpMethod.DELETE, HTTP_204_NO_CONTENT),
+]
+http_methods = [(HttpMethod.GET, HTTP_200_OK), *data_methods]
 
-@pytest.mark.parametrize(
-    "decorator, http_method, expected_status_code",
-    [
-        (post, HttpMethod.POST, HTTP_201_CREATED),
-        (put, HttpMethod.PUT, HTTP_200_OK),
-        (patch, HttpMethod.PATCH, HTTP_200_OK),
-        (delete, HttpMethod.DELETE, HTTP_204_NO_CONTENT),
-    ],
-)
-def test_data_using_model(decorator: Any, http_method: Any, expected_status_code: Any) -> None:
+
+def test_data_using_model() -> None:
     test_path = "/person"
 
+    def assert_data(data: DataclassPerson) -> None:
+        assert data == person_instance
+
     class MyController(Controller):
         path = test_path
 
-        @decorator()
-        def test_method(self, data: DataclassPerson) -> None:
-            assert data == person_instance
+        @post()
+        def post_method(self, data: DataclassPerson) -> None:
+            assert_data(data)
+
+        @put()
+        def put_method(self, data: DataclassPerson) -> None:
+            assert_data(data)
+
+        @patch()
+        def patch_method(self, data: DataclassPerson) -> None:
+            assert_data(data)
+
+        @delete()
+        def delete_method(self, data: DataclassPerson) -> None:
+            assert_data(data)
 
     with create_test_client(MyController) as client:
-        response = client.request(http_method, test_path, json=msgspec.to_builtins(person_instance))
-        assert response.status_code == expected_status_code
-
-
-@pytest.mark.parametrize(
-    "decorator, http_method, expected_status_code",
-    [
-        (post, HttpMethod.POST, HTTP_201_CREATED),
-        (put, HttpMethod.PUT, HTTP_200_OK),
-        (patch, HttpMethod.PATCH, HTTP_200_OK),
-        (delete, HttpMethod.DELETE, HTTP_204_NO_CONTENT),
-    ],
-)
-def test_data_using_list_of_models(decorator: Any, http_method: Any, expected_status_code: Any) -> None:
+        for http_method, expected_status_code in data_methods:
+            response = client.request(http_method, test_path, json=msgspec.to_builtins(person_instance))
+            assert response.status_code == expected_status_code, http_method
+
+
+def test_data_using_list_of_models() -> None:
     test_path = "/person"
 
-    people = DataclassPersonFactory.batch(size=5)
+    def assert_data(data: List[DataclassPerson]) -> None:
+        assert data == people
 
     class MyController(Controller):
         path = test_path
 
-        @decorator()
-        def test_method(self, data: List[DataclassPerson]) -> None:
-            assert data == people
+        @post()
+        def post_method(self, data: List[DataclassPerson]) -> None:
+            assert_data(data)
+
+        @put()
+        def put_method(self, data: List[DataclassPerson]) -> None:
+            assert_data(data)
+
+        @patch()
+        def patch_method(self, data: List[DataclassPerson]) -> None:
+            assert_data(data)
+
+        @delete()
+        def delete_method(self, data: List[DataclassPerson]) -> None:
+            assert_data(data)
 
     with create_test_client(MyController) as client:
-        response = client.request(http_method, test_path, json=msgspec.to_builtins(people))
-        assert response.status_code == expected_status_code
+        for http_method, expected_status_code in data_methods:
+            response = client.request(http_method, test_path, json=msgspec.to_builtins(people))
+            assert response.status_code == expected_status_code, http_method
 
 
 @pytest.mark.parametrize("media_type", [MediaType.JSON, MediaType.MESSAGEPACK])
@@ -127,65 +148,59 @@ def test_request_with_invalid_data(media_type: MediaType) -> None:
         assert response.status_code == HTTP_400_BAD_REQUEST
 
 
-@pytest.mark.parametrize(
-    "decorator, http_method, expected_status_code",
-    [
-        (get, HttpMethod.GET, HTTP_200_OK),
-        (post, HttpMethod.POST, HTTP_201_CREATED),
-        (put, HttpMethod.PUT, HTTP_200_OK),
-        (patch, HttpMethod.PATCH, HTTP_200_OK),
-        (delete, HttpMethod.DELETE, HTTP_204_NO_CONTENT),
-    ],
-)
-def test_path_params(decorator: Any, http_method: Any, expected_status_code: Any) -> None:
+def test_path_params() -> None:
     test_path = "/person"
 
+    def assert_person_id(person_id: str) -> None:
+        assert person_id == person_instance.id
+
     class MyController(Controller):
         path = test_path
 
-        @decorator(path="/{person_id:str}")
-        def test_method(self, person_id: str) -> None:
-            assert person_id == person_instance.id
+        @get(path="/{person_id:str}")
+        def get_method(self, person_id: str) -> None:
+            assert_person_id(person_id)
+
+        @post(path="/{person_id:str}")
+        def post_method(self, person_id: str) -> None:
+            assert_person_id(person_id)
+
+        @put(path="/{person_id:str}")
+        def put_method(self, person_id: str) -> None:
+            assert_person_id(person_id)
+
+        @patch(path="/{person_id:str}")
+        def patch_method(self, person_id: str) -> None:
+            assert_person_id(person_id)
+
+        @delete(path="/{person_id:str}")
+        def delete_method(self, person_id: str) -> None:
+            assert_person_id(person_id)
 
     with create_test_client(MyController) as client:
-        response = client.request(http_method, f"{test_path}/{person_instance.id}")
-        assert response.status_code == expected_status_code
-
-
-@pytest.mark.parametrize(
-    "decorator, http_method, expected_status_code",
-    [
-        (get, HttpMethod.GET, HTTP_200_OK),
-        (post, HttpMethod.POST, HTTP_201_CREATED),
-        (put, HttpMethod.PUT, HTTP_200_OK),
-        (patch, HttpMethod.PATCH, HTTP_200_OK),
-        (delete, HttpMethod.DELETE, HTTP_204_NO_CONTENT),
-    ],
-)
-def test_query_params(decorator: Any, http_method: Any, expected_status_code: Any) -> None:
-    @decorator("/person")
+        for http_method, expected_status_code in http_methods:
+            response = client.request(http_method, f"{test_path}/{person_instance.id}")
+            assert response.status_code == expected_status_code, http_method
+
+
+def test_query_params() -> None:
     def handler(first: str, second: List[str], third: int, fourth: Optional[str] = None) -> None:
         assert first == "foo"
         assert second == ["a", "b"]
         assert third == 2
         assert fourth is None
 
-    with create_test_client(handler) as client:
-        response = client.request(http_method, "/person", params={"first": "foo", "second": ["a", "b"], "third": "2"})
-        assert response.status_code == expected_status_code
+    route_handlers = [decorator("/person")(handler) for decorator in (get, post, put, patch, delete)]
 
+    with create_test_client(route_handlers) as client:
+        for http_method, expected_status_code in http_methods:
+            response = client.request(
+                http_method, "/person", params={"first": "foo", "second": ["a", "b"], "third": "2"}
+            )
+            assert response.status_code == expected_status_code, http_method
 
-@pytest.mark.parametrize(
-    "decorator, http_method, expected_status_code",
-    [
-        (get, HttpMethod.GET, HTTP_200_OK),
-        (post, HttpMethod.POST, HTTP_201_CREATED),
-        (put, HttpMethod.PUT, HTTP_200_OK),
-        (patch, HttpMethod.PATCH, HTTP_200_OK),
-        (delete, HttpMethod.DELETE, HTTP_204_NO_CONTENT),
-    ],
-)
-def test_header_params(decorator: Any, http_method: Any, expected_status_code: Any) -> None:
+
+def test_header_params() -> None:
     test_path = "/person"
 
     request_headers = {
@@ -195,92 +210,133 @@ def test_header_params(decorator: Any, http_method: Any, expected_status_code: A
         "accept": "*/*",
     }
 
+    def assert_headers(headers: dict) -> None:
+        for key, value in request_headers.items():
+            assert headers[key] == value
+
     class MyController(Controller):
         path = test_path
 
-        @decorator()
-        def test_method(self, headers: dict) -> None:
-            for key, value in request_headers.items():
-                assert headers[key] == value
+        @get()
+        def get_method(self, headers: dict) -> None:
+            assert_headers(headers)
+
+        @post()
+        def post_method(self, headers: dict) -> None:
+            assert_headers(headers)
+
+        @put()
+        def put_method(self, headers: dict) -> None:
+            assert_headers(headers)
+
+        @patch()
+        def patch_method(self, headers: dict) -> None:
+            assert_headers(headers)
+
+        @delete()
+        def delete_method(self, headers: dict) -> None:
+            assert_headers(headers)
 
     with create_test_client(MyController) as client:
-        response = client.request(http_method, test_path, headers=request_headers)
-        assert response.status_code == expected_status_code
-
-
-@pytest.mark.parametrize(
-    "decorator, http_method, expected_status_code",
-    [
-        (get, HttpMethod.GET, HTTP_200_OK),
-        (post, HttpMethod.POST, HTTP_201_CREATED),
-        (put, HttpMethod.PUT, HTTP_200_OK),
-        (patch, HttpMethod.PATCH, HTTP_200_OK),
-        (delete, HttpMethod.DELETE, HTTP_204_NO_CONTENT),
-    ],
-)
-def test_request(decorator: Any, http_method: Any, expected_status_code: Any) -> None:
+        for http_method, expected_status_code in http_methods:
+            response = client.request(http_method, test_path, headers=request_headers)
+            assert response.status_code == expected_status_code, http_method
+
+
+def test_request() -> None:
     test_path = "/person"
 
     class MyController(Controller):
         path = test_path
 
-        @decorator()
-        def test_method(self, request: Request) -> None:
+        @get()
+        def get_method(self, request: Request) -> None:
+            assert isinstance(request, Request)
+
+        @post()
+        def post_method(self, request: Request) -> None:
+            assert isinstance(request, Request)
+
+        @put()
+        def put_method(self, request: Request) -> None:
+            assert isinstance(request, Request)
+
+        @patch()
+        def patch_method(self, request: Request) -> None:
+            assert isinstance(request, Request)
+
+        @delete()
+        def delete_method(self, request: Request) -> None:
             assert isinstance(request, Request)
 
     with create_test_client(MyController) as client:
-        response = client.request(http_method, test_path)
-        assert response.status_code == expected_status_code
-
-
-@pytest.mark.parametrize(
-    "decorator, http_method, expected_status_code",
-    [
-        (get, HttpMethod.GET, HTTP_200_OK),
-        (post, HttpMethod.POST, HTTP_201_CREATED),
-        (put, HttpMethod.PUT, HTTP_200_OK),
-        (patch, HttpMethod.PATCH, HTTP_200_OK),
-        (delete, HttpMethod.DELETE, HTTP_204_NO_CONTENT),
-    ],
-)
-def test_scope(decorator: Any, http_method: Any, expected_status_code: Any) -> None:
+        for http_method, expected_status_code in http_methods:
+            response = client.request(http_method, test_path)
+            assert response.status_code == expected_status_code, http_method
+
+
+def test_scope() -> None:
     test_path = "/person"
 
     class MyController(Controller):
         path = test_path
 
-        @decorator()
-        def test_method(self, scope: Scope) -> None:
+        @get()
+        def get_method(self, scope: Scope) -> None:
+            assert isinstance(scope, dict)
+
+        @post()
+        def post_method(self, scope: Scope) -> None:
+            assert isinstance(scope, dict)
+
+        @put()
+        def put_method(self, scope: Scope) -> None:
+            assert isinstance(scope, dict)
+
+        @patch()
+        def patch_method(self, scope: Scope) -> None:
+            assert isinstance(scope, dict)
+
+        @delete()
+        def delete_method(self, scope: Scope) -> None:
             assert isinstance(scope, dict)
 
     with create_test_client(MyController) as client:
-        response = client.request(http_method, test_path)
-        assert response.status_code == expected_status_code
-
-
-@pytest.mark.parametrize(
-    "decorator, http_method, expected_status_code",
-    [
-        (get, HttpMethod.GET, HTTP_200_OK),
-        (post, HttpMethod.POST, HTTP_201_CREATED),
-        (put, HttpMethod.PUT, HTTP_200_OK),
-        (patch, HttpMethod.PATCH, HTTP_200_OK),
-        (delete, HttpMethod.DELETE, HTTP_204_NO_CONTENT),
-    ],
-)
-def test_body(decorator: Any, http_method: Any, expected_status_code: Any) -> None:
+        for http_method, expected_status_code in http_methods:
+            response = client.request(http_method, test_path)
+            assert response.status_code == expected_status_code, http_method
+
+
+def test_body() -> None:
     test_path = "/person"
 
     class MyController(Controller):
         path = test_path
 
-        @decorator()
-        async def test_method(self, request: Request[Any, Any, Any], body: bytes) -> None:
+        @get()
+        async def get_method(self, request: Request[Any, Any, Any], body: bytes) -> None:
+            assert body == await request.body()
+
+        @post()
+        async def post_method(self, request: Request[Any, Any, Any], body: bytes) -> None:
+            assert body == await request.body()
+
+        @put()
+        async def put_method(self, request: Request[Any, Any, Any], body: bytes) -> None:
+            assert body == await request.body()
+
+        @patch()
+        async def patch_method(self, request: Request[Any, Any, Any], body: bytes) -> None:
+            assert body == await request.body()
+
+        @delete()
+        async def delete_method(self, request: Request[Any, Any, Any], body: bytes) -> None:
             assert body == await request.body()
 
     with create_test_client(MyController) as client:
-        response = client.request(http_method, test_path)
-        assert response.status_code == expected_status_code
+        for http_method, expected_status_code in http_methods:
+            response = client.request(http_method, test_path)
+            assert response.status_code == expected_status_code, http_method
 
 
 def test_improper_use_of_state_kwarg() -> None:
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -9,6 +9,7 @@ from litestar.middleware import MiddlewareProtocol
 from litestar.middleware.allowed_hosts import AllowedHostsMiddleware
 from litestar.status_codes import HTTP_200_OK, HTTP_400_BAD_REQUEST
 from litestar.testing import create_test_client
+from tests.helpers import unpack_middleware
 
 if TYPE_CHECKING:
     from litestar.types import Receive, Scope, Send
@@ -24,12 +25,9 @@ def test_allowed_hosts_middleware() -> None:
     def handler() -> None: ...
 
     client = create_test_client(route_handlers=[handler], allowed_hosts=["*.example.com", "moishe.zuchmir.com"])
-    unpacked_middleware = []
-    cur = client.app.asgi_router.root_route_map_node.children["/"].asgi_handlers["GET"][0]
-    while hasattr(cur, "app"):
-        unpacked_middleware.append(cur)
-        cur = cast("Any", cur.app)
-    unpacked_middleware.append(cur)
+    unpacked_middleware = unpack_middleware(
+        client.app.asgi_router.root_route_map_node.children["/"].asgi_handlers["GET"][0]
+    )
 
     allowed_hosts_middleware, *_ = unpacked_middleware
     assert isinstance(allowed_hosts_middleware, AllowedHostsMiddleware)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Iterator
 
 import pytest
 
@@ -17,7 +17,7 @@ from litestar.status_codes import (
     HTTP_403_FORBIDDEN,
     HTTP_500_INTERNAL_SERVER_ERROR,
 )
-from litestar.testing import create_test_client
+from litestar.testing import TestClient, create_test_client
 
 if TYPE_CHECKING:
     from litestar.connection import ASGIConnection
@@ -40,54 +40,25 @@ class Auth:
 
 user = User(name="moishe", id=100)
 auth = Auth(props="abc")
+auth_result = AuthenticationResult(user=user, auth=auth)
 
 state: Dict[str, AuthenticationResult] = {}
 
 
 class AuthMiddleware(AbstractAuthenticationMiddleware):
     async def authenticate_request(self, connection: "ASGIConnection") -> AuthenticationResult:
-        param = connection.headers.get("Authorization")
-        if param in state:
-            return state.pop(param)
+        if result := state.pop(connection.headers.get("Authorization", ""), None):
+            return result
         raise PermissionDeniedException("unauthenticated")
 
 
-def test_authentication_middleware_http_routes() -> None:
-    @get(path="/")
-    def http_route_handler(request: Request[User, Auth, Any]) -> None:
-        assert isinstance(request.user, User)
-        assert isinstance(request.auth, Auth)
+@get(path="/", sync_to_thread=False)
+def http_route_handler(request: Request[User, Auth, Any]) -> None:
+    assert isinstance(request.user, User)
+    assert isinstance(request.auth, Auth)
 
-    client = create_test_client(route_handlers=[http_route_handler], middleware=[AuthMiddleware])
-    token = "abc"
-    error_response = client.get("/", headers={"Authorization": token})
-    assert error_response.status_code == HTTP_403_FORBIDDEN
-    state[token] = AuthenticationResult(user=user, auth=auth)
-    success_response = client.get("/", headers={"Authorization": token})
-    assert success_response.status_code == HTTP_200_OK
-
-
-def test_authentication_middleware_not_installed_raises_for_user_scope_http() -> None:
-    @get(path="/")
-    def http_route_handler_user_scope(request: Request[User, None, Any]) -> None:
-        assert request.user
 
-    client = create_test_client(route_handlers=[http_route_handler_user_scope])
-    error_response = client.get("/", headers={"Authorization": "nope"})
-    assert error_response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
-
-
-def test_authentication_middleware_not_installed_raises_for_auth_scope_http() -> None:
-    @get(path="/")
-    def http_route_handler_auth_scope(request: Request[None, Auth, Any]) -> None:
-        assert request.auth
-
-    client = create_test_client(route_handlers=[http_route_handler_auth_scope])
-    error_response = client.get("/", headers={"Authorization": "nope"})
-    assert error_response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
-
-
-@websocket(path="/")
+@websocket(path="/ws")
 async def websocket_route_handler(socket: WebSocket[User, Auth, Any]) -> None:
     await socket.accept()
     assert isinstance(socket.user, User)
@@ -97,107 +68,118 @@ async def websocket_route_handler(socket: WebSocket[User, Auth, Any]) -> None:
     await socket.close()
 
 
-def test_authentication_middleware_websocket_routes() -> None:
-    token = "abc"
-    client = create_test_client(route_handlers=websocket_route_handler, middleware=[AuthMiddleware])
-    with pytest.raises(WebSocketDisconnect), client.websocket_connect("/", headers={"Authorization": token}) as ws:
-        assert ws.receive_json()
-    state[token] = AuthenticationResult(user=user, auth=auth)
-    with client.websocket_connect("/", headers={"Authorization": token}) as ws:
-        assert ws.receive_json()
+@pytest.fixture(scope="module")
+def auth_client() -> Iterator[TestClient]:
+    with create_test_client(
+        route_handlers=[http_route_handler, websocket_route_handler], middleware=[AuthMiddleware]
+    ) as client:
+        yield client
 
 
-def test_authentication_middleware_not_installed_raises_for_user_scope_websocket() -> None:
-    @websocket(path="/")
-    async def route_handler(socket: WebSocket[User, Auth, Any]) -> None:
-        await socket.accept()
-        assert isinstance(socket.user, User)
+@get(path="/user-scope-http", sync_to_thread=False)
+def http_route_handler_user_scope(request: Request[User, None, Any]) -> None:
+    assert request.user
 
-    client = create_test_client(route_handlers=route_handler)
-    with pytest.raises(WebSocketDisconnect), client.websocket_connect("/", headers={"Authorization": "yep"}) as ws:
-        ws.receive_json()
 
+@get(path="/auth-scope-http", sync_to_thread=False)
+def http_route_handler_auth_scope(request: Request[None, Auth, Any]) -> None:
+    assert request.auth
 
-def test_authentication_middleware_not_installed_raises_for_auth_scope_websocket() -> None:
-    @websocket(path="/")
-    async def route_handler(socket: WebSocket[User, Auth, Any]) -> None:
-        await socket.accept()
-        assert isinstance(socket.auth, Auth)
-
-    client = create_test_client(route_handlers=route_handler)
-    with pytest.raises(WebSocketDisconnect), client.websocket_connect("/", headers={"Authorization": "yep"}) as ws:
-        ws.receive_json()
 
+@websocket(path="/user-scope-ws")
+async def websocket_route_handler_user_scope(socket: WebSocket[User, Auth, Any]) -> None:
+    await socket.accept()
+    assert isinstance(socket.user, User)
 
-def test_authentication_middleware_exclude() -> None:
-    auth_mw = DefineMiddleware(AuthMiddleware, exclude=["north", "south"])
 
-    @get("/north/{value:int}")
-    def north_handler(value: int) -> Dict[str, int]:
-        return {"value": value}
-
-    @get("/south")
-    def south_handler() -> None:
-        return None
+@websocket(path="/auth-scope-ws")
+async def websocket_route_handler_auth_scope(socket: WebSocket[User, Auth, Any]) -> None:
+    await socket.accept()
+    assert isinstance(socket.auth, Auth)
 
-    @get("/west")
-    def west_handler() -> None:
-        return None
 
+@pytest.fixture(scope="module")
+def no_auth_client() -> Iterator[TestClient]:
     with create_test_client(
-        route_handlers=[north_handler, south_handler, west_handler],
-        middleware=[auth_mw],
+        route_handlers=[
+            http_route_handler_user_scope,
+            http_route_handler_auth_scope,
+            websocket_route_handler_user_scope,
+            websocket_route_handler_auth_scope,
+        ]
     ) as client:
-        response = client.get("/north/1")
-        assert response.status_code == HTTP_200_OK
+        yield client
 
-        response = client.get("/south")
-        assert response.status_code == HTTP_200_OK
 
-        response = client.get("/west")
-        assert response.status_code == HTTP_403_FORBIDDEN
+@pytest.fixture(autouse=True)
+def clear_state() -> Iterator[None]:
+    state.clear()
+    yield
+    state.clear()
 
 
-def test_authentication_middleware_exclude_from_auth() -> None:
-    auth_mw = DefineMiddleware(AuthMiddleware, exclude=["south", "east"])
-
-    @get("/north/{value:int}", exclude_from_auth=True)
-    def north_handler(value: int) -> Dict[str, int]:
-        return {"value": value}
-
-    @get("/south")
-    def south_handler() -> None:
-        return None
+def test_authentication_middleware_http_routes(auth_client: TestClient) -> None:
+    token = "abc"
+    error_response = auth_client.get("/", headers={"Authorization": token})
+    assert error_response.status_code == HTTP_403_FORBIDDEN
+    state[token] = auth_result
+    success_response = auth_client.get("/", headers={"Authorization": token})
+    assert success_response.status_code == HTTP_200_OK
 
-    @get("/west")
-    def west_handler() -> None:
-        return None
 
-    @get("/east", exclude_from_auth=True)
-    def east_handler() -> None:
-        return None
+def test_authentication_middleware_websocket_routes(auth_client: TestClient) -> None:
+    token = "abc"
+    headers = {"Authorization": token}
+    with pytest.raises(WebSocketDisconnect), auth_client.websocket_connect("/ws", headers=headers) as ws:
+        assert ws.receive_json()
+    state[token] = auth_result
+    with auth_client.websocket_connect("/ws", headers=headers) as ws:
+        assert ws.receive_json()
 
-    with create_test_client(
-        route_handlers=[north_handler, south_handler, west_handler, east_handler],
-        middleware=[auth_mw],
-    ) as client:
-        response = client.get("/north/1")
-        assert response.status_code == HTTP_200_OK
 
-        response = client.get("/south")
-        assert response.status_code == HTTP_200_OK
+@pytest.mark.parametrize("path", ["/user-scope-http", "/auth-scope-http"])
+def test_authentication_middleware_not_installed_raises_for_http_scope(no_auth_client: TestClient, path: str) -> None:
+    error_response = no_auth_client.get(path, headers={"Authorization": "nope"})
+    assert error_response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
 
-        response = client.get("/east")
-        assert response.status_code == HTTP_200_OK
 
-        response = client.get("/west")
-        assert response.status_code == HTTP_403_FORBIDDEN
+@pytest.mark.parametrize("path", ["/user-scope-ws", "/auth-scope-ws"])
+def test_authentication_middleware_not_installed_raises_for_websocket_scope(
+    no_auth_client: TestClient, path: str
+) -> None:
+    with pytest.raises(WebSocketDisconnect), no_auth_client.websocket_connect(
+        path, headers={"Authorization": "yep"}
+    ) as ws:
+        ws.receive_json()
 
 
-def test_authentication_middleware_exclude_from_auth_custom_key() -> None:
-    auth_mw = DefineMiddleware(AuthMiddleware, exclude=["south", "east"], exclude_from_auth_key="my_exclude_key")
+@pytest.mark.parametrize(
+    "middleware_kwargs, exclude_opt, expected_status_codes",
+    [
+        (
+            {"exclude": ["north", "south"]},
+            {},
+            {"/north/1": HTTP_200_OK, "/south": HTTP_200_OK, "/east": HTTP_403_FORBIDDEN, "/west": HTTP_403_FORBIDDEN},
+        ),
+        (
+            {"exclude": ["south", "east"]},
+            {"exclude_from_auth": True},
+            {"/north/1": HTTP_200_OK, "/south": HTTP_200_OK, "/east": HTTP_200_OK, "/west": HTTP_403_FORBIDDEN},
+        ),
+        (
+            {"exclude": ["south", "east"], "exclude_from_auth_key": "my_exclude_key"},
+            {"my_exclude_key": True},
+            {"/north/1": HTTP_200_OK, "/south": HTTP_200_OK, "/east": HTTP_200_OK, "/west": HTTP_403_FORBIDDEN},
+        ),
+    ],
+    ids=["exclude", "exclude_from_auth", "exclude_from_auth_custom_key"],
+)
+def test_authentication_middleware_exclude(
+    middleware_kwargs: Dict[str, Any], exclude_opt: Dict[str, Any], expected_status_codes: Dict[str, int]
+) -> None:
+    auth_mw = DefineMiddleware(AuthMiddleware, **middleware_kwargs)
 
-    @get("/north/{value:int}", my_exclude_key=True)
+    @get("/north/{value:int}", **exclude_opt)
     def north_handler(value: int) -> Dict[str, int]:
         return {"value": value}
 
@@ -209,7 +191,7 @@ def test_authentication_middleware_exclude_from_auth_custom_key() -> None:
     def west_handler() -> None:
         return None
 
-    @get("/east", my_exclude_key=True)
+    @get("/east", **exclude_opt)
     def east_handler() -> None:
         return None
 
@@ -217,17 +199,9 @@ def test_authentication_middleware_exclude_from_auth_custom_key() -> None:
         route_handlers=[north_handler, south_handler, west_handler, east_handler],
         middleware=[auth_mw],
     ) as client:
-        response = client.get("/north/1")
-        assert response.status_code == HTTP_200_OK
-
-        response = client.get("/south")
-        assert response.status_code == HTTP_200_OK
-
-        response = client.get("/east")
-        assert response.status_code == HTTP_200_OK
-
-        response = client.get("/west")
-        assert response.status_code == HTTP_403_FORBIDDEN
+        for path, expected_status_code in expected_status_codes.items():
+            response = client.get(path)
+            assert response.status_code == expected_status_code, path
 
 
 def test_authentication_exclude_http_methods() -> None:
@@ -1,6 +1,6 @@
 import zlib
 from io import BytesIO
-from typing import AsyncIterator, Callable, Literal, Union
+from typing import AsyncIterator, Callable, Dict, Iterator, Literal, Union
 from unittest.mock import MagicMock
 
 import pytest
@@ -14,19 +14,24 @@ from litestar.middleware.compression import CompressionMiddleware
 from litestar.middleware.compression.facade import CompressionFacade
 from litestar.response.streaming import Stream
 from litestar.status_codes import HTTP_200_OK
-from litestar.testing import create_test_client
+from litestar.testing import TestClient, create_test_client
 from litestar.types.asgi_types import ASGIApp, HTTPResponseBodyEvent, HTTPResponseStartEvent, Message, Scope
 
 BrotliMode = Literal["text", "generic", "font"]
 
+TEXT_PAYLOAD = "_litestar_" * 4000
+ENCODED_PAYLOAD = TEXT_PAYLOAD.encode()
+STREAM_CHUNK = b"_litestar_" * 400
+
+
+@get(path="/", media_type=MediaType.TEXT, sync_to_thread=False)
+def text_handler() -> str:
+    return TEXT_PAYLOAD
+
 
 @pytest.fixture()
 def handler() -> HTTPRouteHandler:
-    @get(path="/", media_type=MediaType.TEXT)
-    def handler_fn() -> str:
-        return "_litestar_" * 4000
-
-    return handler_fn
+    return text_handler
 
 
 async def streaming_iter(content: bytes, count: int) -> AsyncIterator[bytes]:
@@ -38,86 +43,96 @@ def test_compression_disabled_for_unsupported_client(handler: HTTPRouteHandler)
     with create_test_client(route_handlers=[handler], compression_config=CompressionConfig(backend="brotli")) as client:
         response = client.get("/", headers={"accept-encoding": "deflate"})
         assert response.status_code == HTTP_200_OK
-        assert response.text == "_litestar_" * 4000
+        assert response.content == ENCODED_PAYLOAD
         assert "Content-Encoding" not in response.headers
-        assert int(response.headers["Content-Length"]) == 40000
+        assert response.headers["Content-Length"] == "40000"
+
+
+@get("/streaming-response", sync_to_thread=False)
+def streaming_handler() -> Stream:
+    return Stream(streaming_iter(content=STREAM_CHUNK, count=10))
+
+
+@get(path="/no-compression", media_type=MediaType.TEXT, sync_to_thread=False)
+def no_compress_handler() -> str:
+    return "_litestar_"
+
+
+@pytest.fixture(scope="module")
+def compression_clients() -> Iterator[Dict[str, TestClient]]:
+    route_handlers = [text_handler, streaming_handler, no_compress_handler]
+    with create_test_client(
+        route_handlers=route_handlers, compression_config=CompressionConfig(backend="brotli")
+    ) as brotli_client, create_test_client(
+        route_handlers=route_handlers, compression_config=CompressionConfig(backend="gzip")
+    ) as gzip_client:
+        yield {"brotli": brotli_client, "gzip": gzip_client}
 
 
 @pytest.mark.parametrize(
     "backend, compression_encoding", (("brotli", CompressionEncoding.BROTLI), ("gzip", CompressionEncoding.GZIP))
 )
 def test_regular_compressed_response(
-    backend: Literal["gzip", "brotli"], compression_encoding: CompressionEncoding, handler: HTTPRouteHandler
+    backend: Literal["gzip", "brotli"],
+    compression_encoding: CompressionEncoding,
+    compression_clients: Dict[str, TestClient],
 ) -> None:
-    with create_test_client(route_handlers=[handler], compression_config=CompressionConfig(backend="brotli")) as client:
-        response = client.get("/", headers={"Accept-Encoding": str(compression_encoding.value)})
-        assert response.status_code == HTTP_200_OK
-        assert response.text == "_litestar_" * 4000
-        assert response.headers["Content-Encoding"] == compression_encoding
-        assert int(response.headers["Content-Length"]) < 40000
+    response = compression_clients[backend].get("/", headers={"Accept-Encoding": str(compression_encoding.value)})
+    assert response.status_code == HTTP_200_OK
+    assert response.content == ENCODED_PAYLOAD
+    assert response.headers["Content-Encoding"] == compression_encoding
+    assert int(response.headers["Content-Length"]) < 40000
 
 
 @pytest.mark.parametrize(
     "backend, compression_encoding", (("brotli", CompressionEncoding.BROTLI), ("gzip", CompressionEncoding.GZIP))
 )
 def test_compression_works_for_streaming_response(
-    backend: Literal["gzip", "brotli"], compression_encoding: CompressionEncoding
+    backend: Literal["gzip", "brotli"],
+    compression_encoding: CompressionEncoding,
+    compression_clients: Dict[str, TestClient],
 ) -> None:
-    @get("/streaming-response")
-    def streaming_handler() -> Stream:
-        return Stream(streaming_iter(content=b"_litestar_" * 400, count=10))
-
-    with create_test_client(
-        route_handlers=[streaming_handler], compression_config=CompressionConfig(backend=backend)
-    ) as client:
-        response = client.get("/streaming-response", headers={"Accept-Encoding": str(compression_encoding.value)})
-        assert response.status_code == HTTP_200_OK
-        assert response.text == "_litestar_" * 4000
-        assert response.headers["Content-Encoding"] == compression_encoding
-        assert "Content-Length" not in response.headers
+    response = compression_clients[backend].get(
+        "/streaming-response", headers={"Accept-Encoding": str(compression_encoding.value)}
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.content == ENCODED_PAYLOAD
+    assert response.headers["Content-Encoding"] == compression_encoding
+    assert "Content-Length" not in response.headers
 
 
 @pytest.mark.parametrize(
     "backend, compression_encoding", (("brotli", CompressionEncoding.BROTLI), ("gzip", CompressionEncoding.GZIP))
 )
 def test_compression_skips_small_responses(
-    backend: Literal["gzip", "brotli"], compression_encoding: CompressionEncoding
+    backend: Literal["gzip", "brotli"],
+    compression_encoding: CompressionEncoding,
+    compression_clients: Dict[str, TestClient],
 ) -> None:
-    @get(path="/no-compression", media_type=MediaType.TEXT)
-    def no_compress_handler() -> str:
-        return "_litestar_"
-
-    with create_test_client(
-        route_handlers=[no_compress_handler], compression_config=CompressionConfig(backend=backend)
-    ) as client:
-        response = client.get("/no-compression", headers={"Accept-Encoding": str(compression_encoding.value)})
-        assert response.status_code == HTTP_200_OK
-        assert response.text == "_litestar_"
-        assert "Content-Encoding" not in response.headers
-        assert int(response.headers["Content-Length"]) == 10
-
-
-def test_brotli_with_gzip_fallback_enabled(handler: HTTPRouteHandler) -> None:
-    with create_test_client(
-        route_handlers=[handler], compression_config=CompressionConfig(backend="brotli", brotli_gzip_fallback=True)
-    ) as client:
-        response = client.get("/", headers={"accept-encoding": CompressionEncoding.GZIP.value})
-        assert response.status_code == HTTP_200_OK
-        assert response.text == "_litestar_" * 4000
-        assert response.headers["Content-Encoding"] == CompressionEncoding.GZIP
-        assert int(response.headers["Content-Length"]) < 40000
+    response = compression_clients[backend].get(
+        "/no-compression", headers={"Accept-Encoding": str(compression_encoding.value)}
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.content == b"_litestar_"
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Content-Length"] == "10"
 
 
-def test_brotli_gzip_fallback_disabled(handler: HTTPRouteHandler) -> None:
+@pytest.mark.parametrize("brotli_gzip_fallback", (True, False))
+def test_brotli_gzip_fallback(handler: HTTPRouteHandler, brotli_gzip_fallback: bool) -> None:
     with create_test_client(
         route_handlers=[handler],
-        compression_config=CompressionConfig(backend="brotli", brotli_gzip_fallback=False),
+        compression_config=CompressionConfig(backend="brotli", brotli_gzip_fallback=brotli_gzip_fallback),
     ) as client:
-        response = client.get("/", headers={"accept-encoding": "gzip"})
+        response = client.get("/", headers={"accept-encoding": CompressionEncoding.GZIP.value})
         assert response.status_code == HTTP_200_OK
-        assert response.text == "_litestar_" * 4000
-        assert "Content-Encoding" not in response.headers
-        assert int(response.headers["Content-Length"]) == 40000
+        assert response.content == ENCODED_PAYLOAD
+        if brotli_gzip_fallback:
+            assert response.headers["Content-Encoding"] == CompressionEncoding.GZIP
+            assert int(response.headers["Content-Length"]) < 40000
+        else:
+            assert "Content-Encoding" not in response.headers
+            assert response.headers["Content-Length"] == "40000"
 
 
 async def test_skips_for_websocket() -> None:
@@ -204,7 +219,7 @@ async def test_compression_streaming_response_emitted_messages(
     "backend, compression_encoding", (("brotli", CompressionEncoding.BROTLI), ("gzip", CompressionEncoding.GZIP))
 )
 def test_dont_recompress_cached(backend: Literal["gzip", "brotli"], compression_encoding: CompressionEncoding) -> None:
-    mock = MagicMock(return_value="_litestar_" * 4000)
+    mock = MagicMock(return_value=TEXT_PAYLOAD)
 
     @get(path="/", media_type=MediaType.TEXT, cache=True)
     def handler_fn() -> str:
@@ -218,7 +233,7 @@ def test_dont_recompress_cached(backend: Literal["gzip", "brotli"], compression_
 
     assert mock.call_count == 1
     assert response.status_code == HTTP_200_OK
-    assert response.text == "_litestar_" * 4000
+    assert response.content == ENCODED_PAYLOAD
     assert response.headers["Content-Encoding"] == compression_encoding
     assert int(response.headers["Content-Length"]) < 40000
 
@@ -247,6 +262,6 @@ def test_compression_with_custom_backend(handler: HTTPRouteHandler) -> None:
     with create_test_client([handler], compression_config=config) as client:
         response = client.get("/", headers={"Accept-Encoding": "deflate"})
         assert response.status_code == HTTP_200_OK
-        assert response.text == "_litestar_" * 4000
+        assert response.content == ENCODED_PAYLOAD
         assert response.headers["Content-Encoding"] == "deflate"
         assert int(response.headers["Content-Length"]) < 40000
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Literal, Mapping, Optional, Union, cast
+from typing import Dict, List, Literal, Mapping, Optional, Union
 
 import pytest
 
@@ -8,6 +8,7 @@ from litestar.middleware._internal.cors import CORSMiddleware
 from litestar.status_codes import HTTP_200_OK, HTTP_404_NOT_FOUND
 from litestar.testing import create_test_client
 from litestar.types.asgi_types import Method
+from tests.helpers import unpack_middleware
 
 
 def test_setting_cors_middleware() -> None:
@@ -21,14 +22,9 @@ def test_setting_cors_middleware() -> None:
     assert cors_config.expose_headers == []
 
     with create_test_client(cors_config=cors_config) as client:
-        unpacked_middleware = []
-        cur = client.app.asgi_handler
-        while hasattr(cur, "app"):
-            unpacked_middleware.append(cur)
-            cur = cast("Any", cur.app)
-        unpacked_middleware.append(cur)
+        unpacked_middleware = unpack_middleware(client.app.asgi_handler)
         assert len(unpacked_middleware) == 4
-        cors_middleware = cast("Any", unpacked_middleware[0])
+        cors_middleware = unpacked_middleware[0]
         assert isinstance(cors_middleware, CORSMiddleware)
         assert cors_middleware.config.allow_headers == ["*"]
         assert cors_middleware.config.allow_methods == ["*"]
@@ -1,22 +1,22 @@
 import html
+import re
 from os import urandom
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Iterator, Optional
 
 import pytest
-from bs4 import BeautifulSoup
 
 from litestar import MediaType, WebSocket, delete, get, patch, post, put, websocket
 from litestar.config.csrf import CSRFConfig
-from litestar.contrib.jinja import JinjaTemplateEngine
-from litestar.contrib.mako import MakoTemplateEngine
 from litestar.enums import RequestEncodingType
 from litestar.handlers import HTTPRouteHandler
 from litestar.params import Body
 from litestar.response.template import Template
 from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED, HTTP_403_FORBIDDEN
-from litestar.template.config import TemplateConfig
-from litestar.testing import create_test_client
+from litestar.testing import TestClient, create_test_client
+
+CSRF_SECRET = urandom(10).hex()
+CSRF_INPUT_PATTERN = re.compile(r'name="_csrf_token" value="([^"]+)"')
 
 
 def handler_fn() -> None:
@@ -33,97 +33,77 @@ def post_handler() -> HTTPRouteHandler:
     return post()(handler_fn)
 
 
-@pytest.fixture
-def put_handler() -> HTTPRouteHandler:
-    return put()(handler_fn)
+@pytest.fixture(scope="module")
+def csrf_app_client() -> Iterator[TestClient]:
+    with create_test_client(
+        route_handlers=[decorator()(handler_fn) for decorator in (get, post, put, delete, patch)],
+        csrf_config=CSRFConfig(secret="secret"),
+    ) as client:
+        yield client
 
 
 @pytest.fixture
-def delete_handler() -> HTTPRouteHandler:
-    return delete()(handler_fn)
+def csrf_client(csrf_app_client: TestClient) -> TestClient:
+    csrf_app_client.cookies.clear()
+    return csrf_app_client
 
 
-@pytest.fixture
-def patch_handler() -> HTTPRouteHandler:
-    return patch()(handler_fn)
+@pytest.fixture(scope="module")
+def csrf_cookie(csrf_app_client: TestClient) -> str:
+    csrf_app_client.cookies.clear()
+    response = csrf_app_client.get("/")
+    assert response.status_code == HTTP_200_OK
 
+    csrf_token: Optional[str] = response.cookies.get("csrftoken")
+    assert csrf_token is not None
+    return csrf_token
 
-def test_csrf_successful_flow(get_handler: HTTPRouteHandler, post_handler: HTTPRouteHandler) -> None:
-    with create_test_client(
-        route_handlers=[get_handler, post_handler], csrf_config=CSRFConfig(secret="secret")
-    ) as client:
-        response = client.get("/")
-        assert response.status_code == HTTP_200_OK
 
-        csrf_token: Optional[str] = response.cookies.get("csrftoken")
-        assert csrf_token is not None
+def test_csrf_successful_flow(csrf_client: TestClient) -> None:
+    response = csrf_client.get("/")
+    assert response.status_code == HTTP_200_OK
 
-        set_cookie_header = response.headers.get("set-cookie")
-        assert set_cookie_header is not None
-        assert set_cookie_header.split("; ") == [
-            f"csrftoken={csrf_token}",
-            "Path=/",
-            "SameSite=lax",
-        ]
+    csrf_token: Optional[str] = response.cookies.get("csrftoken")
+    assert csrf_token is not None
 
-        response = client.post("/", headers={"x-csrftoken": csrf_token})
-        assert response.status_code == HTTP_201_CREATED
+    assert response.headers.get("set-cookie") == f"csrftoken={csrf_token}; Path=/; SameSite=lax"
+
+    response = csrf_client.post("/", headers={"x-csrftoken": csrf_token})
+    assert response.status_code == HTTP_201_CREATED
 
 
 @pytest.mark.parametrize(
     "method",
     ["POST", "PUT", "DELETE", "PATCH"],
 )
-def test_unsafe_method_fails_without_csrf_header(
-    method: str,
-    get_handler: HTTPRouteHandler,
-    post_handler: HTTPRouteHandler,
-    put_handler: HTTPRouteHandler,
-    delete_handler: HTTPRouteHandler,
-    patch_handler: HTTPRouteHandler,
-) -> None:
-    with create_test_client(
-        route_handlers=[get_handler, post_handler, put_handler, delete_handler, patch_handler],
-        csrf_config=CSRFConfig(secret="secret"),
-    ) as client:
-        response = client.get("/")
-        assert response.status_code == HTTP_200_OK
+def test_unsafe_method_fails_without_csrf_header(method: str, csrf_client: TestClient, csrf_cookie: str) -> None:
+    csrf_client.cookies.set("csrftoken", csrf_cookie)
+    response = csrf_client.request(method, "/")
+    assert response.status_code == HTTP_403_FORBIDDEN
+    assert response.json() == {"detail": "CSRF token verification failed", "status_code": 403}
 
-        csrf_token: Optional[str] = response.cookies.get("csrftoken")
-        assert csrf_token is not None
 
-        response = client.request(method, "/")
-        assert response.status_code == HTTP_403_FORBIDDEN
-        assert response.json() == {"detail": "CSRF token verification failed", "status_code": 403}
+def test_invalid_csrf_token(csrf_client: TestClient) -> None:
+    response = csrf_client.get("/")
+    assert response.status_code == HTTP_200_OK
 
+    csrf_token: Optional[str] = response.cookies.get("csrftoken")
+    assert csrf_token is not None
 
-def test_invalid_csrf_token(get_handler: HTTPRouteHandler, post_handler: HTTPRouteHandler) -> None:
-    with create_test_client(
-        route_handlers=[get_handler, post_handler], csrf_config=CSRFConfig(secret="secret")
-    ) as client:
-        response = client.get("/")
-        assert response.status_code == HTTP_200_OK
+    response = csrf_client.post("/", headers={"x-csrftoken": f"{csrf_token}invalid"})
+    assert response.status_code == HTTP_403_FORBIDDEN
+    assert response.json() == {"detail": "CSRF token verification failed", "status_code": 403}
 
-        csrf_token: Optional[str] = response.cookies.get("csrftoken")
-        assert csrf_token is not None
 
-        response = client.post("/", headers={"x-csrftoken": f"{csrf_token}invalid"})
-        assert response.status_code == HTTP_403_FORBIDDEN
-        assert response.json() == {"detail": "CSRF token verification failed", "status_code": 403}
+def test_csrf_token_too_short(csrf_client: TestClient) -> None:
+    response = csrf_client.get("/")
+    assert response.status_code == HTTP_200_OK
 
+    assert "csrftoken" in response.cookies
 
-def test_csrf_token_too_short(get_handler: HTTPRouteHandler, post_handler: HTTPRouteHandler) -> None:
-    with create_test_client(
-        route_handlers=[get_handler, post_handler], csrf_config=CSRFConfig(secret="secret")
-    ) as client:
-        response = client.get("/")
-        assert response.status_code == HTTP_200_OK
-
-        assert "csrftoken" in response.cookies
-
-        response = client.post("/", headers={"x-csrftoken": "too-short"})
-        assert response.status_code == HTTP_403_FORBIDDEN
-        assert response.json() == {"detail": "CSRF token verification failed", "status_code": 403}
+    response = csrf_client.post("/", headers={"x-csrftoken": "too-short"})
+    assert response.status_code == HTTP_403_FORBIDDEN
+    assert response.json() == {"detail": "CSRF token verification failed", "status_code": 403}
 
 
 def test_websocket_ignored() -> None:
@@ -156,26 +136,26 @@ def test_custom_csrf_config(get_handler: HTTPRouteHandler, post_handler: HTTPRou
         csrf_token: Optional[str] = response.cookies.get("custom-csrftoken")
         assert csrf_token is not None
 
-        set_cookie_header = response.headers.get("set-cookie")
-        assert set_cookie_header is not None
-        assert set_cookie_header.split("; ") == [
-            f"custom-csrftoken={csrf_token}",
-            "Path=/",
-            "SameSite=lax",
-        ]
+        assert response.headers.get("set-cookie") == f"custom-csrftoken={csrf_token}; Path=/; SameSite=lax"
 
         response = client.post("/", headers={"x-custom-csrftoken": csrf_token})
         assert response.status_code == HTTP_201_CREATED
 
 
 @pytest.mark.parametrize(
-    "engine, template",
+    "engine_name, template",
     (
-        (JinjaTemplateEngine, "{{csrf_input}}"),
-        (MakoTemplateEngine, "${csrf_input}"),
+        ("jinja", "{{csrf_input}}"),
+        ("mako", "${csrf_input}"),
     ),
 )
-def test_csrf_form_parsing(engine: Any, template: str, tmp_path: Path) -> None:
+def test_csrf_form_parsing(engine_name: str, template: str, tmp_path: Path) -> None:
+    from litestar.contrib.jinja import JinjaTemplateEngine
+    from litestar.contrib.mako import MakoTemplateEngine
+    from litestar.template.config import TemplateConfig
+
+    engine = {"jinja": JinjaTemplateEngine, "mako": MakoTemplateEngine}[engine_name]
+
     @get(path="/", media_type=MediaType.HTML)
     def handler() -> Template:
         return Template(template_name="abc.html")
@@ -190,7 +170,7 @@ def test_csrf_form_parsing(engine: Any, template: str, tmp_path: Path) -> None:
             directory=tmp_path,
             engine=engine,
         ),
-        csrf_config=CSRFConfig(secret=str(urandom(10))),
+        csrf_config=CSRFConfig(secret=CSRF_SECRET),
     ) as client:
         url = f"{client.base_url!s}/"
         Path(tmp_path / "abc.html").write_text(
@@ -198,8 +178,9 @@ def test_csrf_form_parsing(engine: Any, template: str, tmp_path: Path) -> None:
         )
         _ = client.get("/")
         response = client.get("/")
-        html_soup = BeautifulSoup(html.unescape(response.text), features="html.parser")
-        data = {"_csrf_token": html_soup.body.div.form.input.attrs.get("value")}  # type: ignore[union-attr]
+        match = CSRF_INPUT_PATTERN.search(html.unescape(response.text))
+        assert match
+        data = {"_csrf_token": match.group(1)}
         response = client.post("/", data=data)
         assert response.status_code == HTTP_201_CREATED
         assert response.json() == data
@@ -212,7 +193,7 @@ def test_csrf_middleware_exclude_from_check_via_opts() -> None:
 
     with create_test_client(
         route_handlers=[post_handler],
-        csrf_config=CSRFConfig(secret=str(urandom(10))),
+        csrf_config=CSRFConfig(secret=CSRF_SECRET),
     ) as client:
         data = {"field": "value"}
         response = client.post("/", data=data)
@@ -220,18 +201,32 @@ def test_csrf_middleware_exclude_from_check_via_opts() -> None:
         assert response.json() == data
 
 
-def test_csrf_middleware_exclude_from_check() -> None:
-    @post("/protected-handler")
+@pytest.mark.parametrize(
+    "csrf_kwargs, protected_opt, unprotected_opt",
+    [
+        ({"exclude": ["unprotected-handler"]}, {}, {}),
+        (
+            {"exclude_from_csrf_key": "custom_exclude_from_csrf"},
+            {"exclude_from_csrf": True},
+            {"custom_exclude_from_csrf": True},
+        ),
+    ],
+    ids=["exclude", "exclude_from_csrf_custom_key"],
+)
+def test_csrf_middleware_exclude_from_check(
+    csrf_kwargs: Dict[str, Any], protected_opt: Dict[str, Any], unprotected_opt: Dict[str, Any]
+) -> None:
+    @post("/protected-handler", **protected_opt)
     def post_handler(data: dict = Body(media_type=RequestEncodingType.URL_ENCODED)) -> dict:
         return data
 
-    @post("/unprotected-handler")
+    @post("/unprotected-handler", **unprotected_opt)
     def post_handler2(data: dict = Body(media_type=RequestEncodingType.URL_ENCODED)) -> dict:
         return data
 
     with create_test_client(
         route_handlers=[post_handler, post_handler2],
-        csrf_config=CSRFConfig(secret=str(urandom(10)), exclude=["unprotected-handler"]),
+        csrf_config=CSRFConfig(secret=CSRF_SECRET, **csrf_kwargs),
     ) as client:
         data = {"field": "value"}
         response = client.post("/protected-handler", data=data)
@@ -256,7 +251,7 @@ def test_csrf_middleware_exclude_from_set_cookies() -> None:
 
     with create_test_client(
         route_handlers=[get_handler, get_handler2],
-        csrf_config=CSRFConfig(secret=str(urandom(10)), exclude=["unprotected-handler"]),
+        csrf_config=CSRFConfig(secret=CSRF_SECRET, exclude=["unprotected-handler"]),
     ) as client:
         response = client.get("/unprotected-handler")
         assert response.status_code == HTTP_200_OK
@@ -265,26 +260,3 @@ def test_csrf_middleware_exclude_from_set_cookies() -> None:
         response = client.get("/protected-handler")
         assert response.status_code == HTTP_200_OK
         assert "set-cookie" in response.headers
-
-
-def test_csrf_middleware_configure_name_for_exclude_from_check_via_opts() -> None:
-    @post("/handler", exclude_from_csrf=True)
-    def post_handler(data: dict = Body(media_type=RequestEncodingType.URL_ENCODED)) -> dict:
-        return data
-
-    @post("/handler2", custom_exclude_from_csrf=True)
-    def post_handler2(data: dict = Body(media_type=RequestEncodingType.URL_ENCODED)) -> dict:
-        return data
-
-    with create_test_client(
-        route_handlers=[post_handler, post_handler2],
-        csrf_config=CSRFConfig(secret=str(urandom(10)), exclude_from_csrf_key="custom_exclude_from_csrf"),
-    ) as client:
-        data = {"field": "value"}
-        response = client.post("/handler", data=data)
-        assert response.status_code == HTTP_403_FORBIDDEN
-
-        data = {"field": "value"}
-        response = client.post("/handler2", data=data)
-        assert response.status_code == HTTP_201_CREATED
-        assert response.json() == data
@@ -1,7 +1,7 @@
 import logging
 import sys
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, cast
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, List
 
 import pytest
 from _pytest.capture import CaptureFixture
@@ -12,6 +12,7 @@ from litestar import Controller, Request, Response, Router, get, post
 from litestar.enums import ScopeType
 from litestar.middleware import DefineMiddleware, MiddlewareProtocol
 from litestar.testing import create_test_client
+from tests.helpers import unpack_middleware
 
 if TYPE_CHECKING:
     from typing import Type
@@ -69,12 +70,9 @@ def test_custom_middleware_processing(middleware: Any) -> None:
         app = client.app
         assert app.middleware == [middleware]
 
-        unpacked_middleware = []
-        cur = client.app.asgi_router.root_route_map_node.children["/"].asgi_handlers["GET"][0]
-        while hasattr(cur, "app"):
-            unpacked_middleware.append(cur)
-            cur = cast("ASGIApp", cur.app)  # pyright: ignore
-        unpacked_middleware.append(cur)
+        unpacked_middleware = unpack_middleware(
+            client.app.asgi_router.root_route_map_node.children["/"].asgi_handlers["GET"][0]
+        )
 
         middleware_instance, *_ = unpacked_middleware
 
@@ -20,7 +20,7 @@ def generate_session_data() -> bytes:
     return encode_json({token_hex(): token_hex()})
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def session_data() -> bytes:
     return generate_session_data()
 
@@ -141,6 +141,12 @@ def person_controller(disable_warn_implicit_sync_to_thread: None) -> Type[Contro
     return create_person_controller()
 
 
+@pytest.fixture(scope="module")
+def module_person_controller(disable_warn_implicit_sync_to_thread: None) -> Type[Controller]:
+    """Module scoped variant of ``person_controller`` for fixtures that build an app once per module."""
+    return create_person_controller()
+
+
 @pytest.fixture
 def pet_controller(disable_warn_implicit_sync_to_thread: None) -> Type[Controller]:
     """Fixture without a top-level mark."""
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, Generic, List, TypeVar
+from typing import Dict, Generic, List, TypeVar, Union
 
 import msgspec
 import pytest
@@ -116,6 +116,17 @@ def test_get_normalized_schema_key() -> None:
     )
 
 
+def test_get_normalized_schema_key_equal_annotations() -> None:
+    assert _get_normalized_schema_key(FieldDefinition.from_annotation(Union[int, str])) == (
+        "typing",
+        "Union_int_str_",
+    )
+    assert _get_normalized_schema_key(FieldDefinition.from_annotation(Union[str, int])) == (
+        "typing",
+        "Union_str_int_",
+    )
+
+
 def test_raise_on_override_for_same_field_definition() -> None:
     registry = SchemaRegistry()
     schema = registry.get_schema_for_field_definition(
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import dataclasses
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Callable, cast
+from typing import Any, Callable
 from unittest.mock import MagicMock
 
 import pytest
@@ -16,17 +16,21 @@ from litestar.exceptions import ImproperlyConfiguredException
 from litestar.handlers.http_handlers import HTTPRouteHandler
 from litestar.openapi.config import OpenAPIConfig
 from litestar.openapi.spec import Operation, PathItem
-from litestar.utils import find_index
+from litestar.routes import HTTPRoute
 
-if TYPE_CHECKING:
-    from litestar.routes import HTTPRoute
+
+def get_routes_by_path_format(app: Litestar) -> dict[str, HTTPRoute]:
+    return {route.path_format: route for route in app.routes if isinstance(route, HTTPRoute)}
+
+
+def get_person_route(person_controller: type[Controller]) -> HTTPRoute:
+    app = Litestar(route_handlers=[person_controller], openapi_config=None)
+    return get_routes_by_path_format(app)["/{service_id}/person/{person_id}"]
 
 
 @pytest.fixture()
 def route(person_controller: type[Controller]) -> HTTPRoute:
-    app = Litestar(route_handlers=[person_controller], openapi_config=None)
-    index = find_index(app.routes, lambda x: x.path_format == "/{service_id}/person/{person_id}")
-    return cast("HTTPRoute", app.routes[index])
+    return get_person_route(person_controller)
 
 
 @pytest.fixture()
@@ -37,42 +41,47 @@ def routes_with_router(person_controller: type[Controller]) -> tuple[HTTPRoute,
     router_v1 = Router(path="/v1", route_handlers=[person_controller])
     router_v2 = Router(path="/v2", route_handlers=[PersonControllerV2])
     app = Litestar(route_handlers=[router_v1, router_v2], openapi_config=None)
-    index_v1 = find_index(app.routes, lambda x: x.path_format == "/v1/{service_id}/person/{person_id}")
-    index_v2 = find_index(app.routes, lambda x: x.path_format == "/v2/{service_id}/person/{person_id}")
-    return cast("HTTPRoute", app.routes[index_v1]), cast("HTTPRoute", app.routes[index_v2])
+    routes = get_routes_by_path_format(app)
+    return routes["/v1/{service_id}/person/{person_id}"], routes["/v2/{service_id}/person/{person_id}"]
 
 
 CreateFactoryFixture: TypeAlias = "Callable[[HTTPRoute], PathItemFactory]"
 
 
+def create_path_item_factory(route: HTTPRoute) -> PathItemFactory:
+    return PathItemFactory(
+        OpenAPIContext(
+            openapi_config=OpenAPIConfig(title="Test", version="1.0.0", description="Test", create_examples=True),
+            plugins=[],
+        ),
+        route,
+    )
+
+
 @pytest.fixture()
 def create_factory() -> CreateFactoryFixture:
-    def factory(route: HTTPRoute) -> PathItemFactory:
-        return PathItemFactory(
-            OpenAPIContext(
-                openapi_config=OpenAPIConfig(title="Test", version="1.0.0", description="Test", create_examples=True),
-                plugins=[],
-            ),
-            route,
-        )
+    return create_path_item_factory
 
-    return factory
 
+@pytest.fixture(scope="module")
+def path_item(module_person_controller: type[Controller]) -> PathItem:
+    # the app's DTO backends are reset after each test, so the path item is built along with its app
+    return create_path_item_factory(get_person_route(module_person_controller)).create_path_item()
 
-def test_create_path_item(route: HTTPRoute, create_factory: CreateFactoryFixture) -> None:
-    schema = create_factory(route).create_path_item()
-    assert schema.delete
-    assert schema.delete.operation_id == "ServiceIdPersonPersonIdDeletePerson"
-    assert schema.delete.summary == "DeletePerson"
-    assert schema.get
-    assert schema.get.operation_id == "ServiceIdPersonPersonIdGetPersonById"
-    assert schema.get.summary == "GetPersonById"
-    assert schema.patch
-    assert schema.patch.operation_id == "ServiceIdPersonPersonIdPartialUpdatePerson"
-    assert schema.patch.summary == "PartialUpdatePerson"
-    assert schema.put
-    assert schema.put.operation_id == "ServiceIdPersonPersonIdUpdatePerson"
-    assert schema.put.summary == "UpdatePerson"
+
+def test_create_path_item(path_item: PathItem) -> None:
+    assert path_item.delete
+    assert path_item.delete.operation_id == "ServiceIdPersonPersonIdDeletePerson"
+    assert path_item.delete.summary == "DeletePerson"
+    assert path_item.get
+    assert path_item.get.operation_id == "ServiceIdPersonPersonIdGetPersonById"
+    assert path_item.get.summary == "GetPersonById"
+    assert path_item.patch
+    assert path_item.patch.operation_id == "ServiceIdPersonPersonIdPartialUpdatePerson"
+    assert path_item.patch.summary == "PartialUpdatePerson"
+    assert path_item.put
+    assert path_item.put.operation_id == "ServiceIdPersonPersonIdUpdatePerson"
+    assert path_item.put.summary == "UpdatePerson"
 
 
 def test_unique_operation_ids_for_multiple_http_methods(create_factory: CreateFactoryFixture) -> None:
@@ -84,14 +93,38 @@ def test_unique_operation_ids_for_multiple_http_methods(create_factory: CreateFa
             pass
 
     app = Litestar(route_handlers=[MultipleMethodsRouteController], openapi_config=None)
-    index = find_index(app.routes, lambda x: x.path_format == "/")
-    route_with_multiple_methods = cast("HTTPRoute", app.routes[index])
+    route_with_multiple_methods = get_routes_by_path_format(app)["/"]
     schema = create_factory(route_with_multiple_methods).create_path_item()
     assert schema.get
     assert schema.get.operation_id
     assert schema.head
     assert schema.head.operation_id
     assert schema.get.operation_id != schema.head.operation_id
+    assert dataclasses.replace(schema.head, operation_id=schema.get.operation_id) == schema.get
+
+
+def test_operation_class_for_multiple_http_methods(create_factory: CreateFactoryFixture) -> None:
+    @dataclass
+    class CustomOperation(Operation):
+        x_method_count: int = field(default=0, init=False)
+
+        def __post_init__(self) -> None:
+            self.tags = ["custom"]
+
+    @HTTPRouteHandler("/", http_method=["GET", "HEAD"], operation_class=CustomOperation)
+    async def handler() -> None:
+        pass
+
+    app = Litestar(route_handlers=[handler], openapi_config=None)
+    schema = create_factory(get_routes_by_path_format(app)["/"]).create_path_item()
+    assert isinstance(schema.get, CustomOperation)
+    assert isinstance(schema.head, CustomOperation)
+    assert schema.get.tags == schema.head.tags == ["custom"]
+
+    schema.get.x_method_count = 1
+    schema.get.tags.append("get-only")
+    assert schema.head.x_method_count == 0
+    assert schema.head.tags == ["custom"]
 
 
 def test_unique_operation_ids_for_multiple_http_methods_with_handler_level_operation_creator(
@@ -105,8 +138,7 @@ def test_unique_operation_ids_for_multiple_http_methods_with_handler_level_opera
             pass
 
     app = Litestar(route_handlers=[MultipleMethodsRouteController], openapi_config=None)
-    index = find_index(app.routes, lambda x: x.path_format == "/")
-    route_with_multiple_methods = cast("HTTPRoute", app.routes[index])
+    route_with_multiple_methods = get_routes_by_path_format(app)["/"]
     factory = create_factory(route_with_multiple_methods)
     factory.context.openapi_config.operation_id_creator = lambda x: "abc"  # type: ignore[assignment, misc]
     schema = create_factory(route_with_multiple_methods).create_path_item()
@@ -128,14 +160,11 @@ def test_routes_with_different_paths_should_generate_unique_operation_ids(
     assert schema_v1.get.operation_id != schema_v2.get.operation_id
 
 
-def test_create_path_item_use_handler_docstring_false(route: HTTPRoute, create_factory: CreateFactoryFixture) -> None:
-    factory = create_factory(route)
-    assert not factory.context.openapi_config.use_handler_docstrings
-    schema = factory.create_path_item()
-    assert schema.get
-    assert schema.get.description is None
-    assert schema.patch
-    assert schema.patch.description == "Description in decorator"
+def test_create_path_item_use_handler_docstring_false(path_item: PathItem) -> None:
+    assert path_item.get
+    assert path_item.get.description is None
+    assert path_item.patch
+    assert path_item.patch.description == "Description in decorator"
 
 
 def test_create_path_item_use_handler_docstring_true(route: HTTPRoute, create_factory: CreateFactoryFixture) -> None:
@@ -211,8 +240,7 @@ def test_handler_excluded_from_schema(create_factory: CreateFactoryFixture) -> N
     def handler_2() -> None: ...
 
     app = Litestar(route_handlers=[handler_1, handler_2])
-    index = find_index(app.routes, lambda x: x.path_format == "/")
-    route_with_multiple_methods = cast("HTTPRoute", app.routes[index])
+    route_with_multiple_methods = get_routes_by_path_format(app)["/"]
     factory = create_factory(route_with_multiple_methods)
     schema = factory.create_path_item()
     assert schema.get
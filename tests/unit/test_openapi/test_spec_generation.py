@@ -5,11 +5,10 @@ from typing import Any, Callable
 import pytest
 from msgspec import Struct
 
-from litestar import delete, post
+from litestar import Litestar, delete, post
 from litestar.openapi import ResponseSpec
 from litestar.openapi.spec import OpenAPI
 from litestar.status_codes import HTTP_204_NO_CONTENT
-from litestar.testing import create_test_client
 from tests.models import DataclassPerson, MsgSpecStructPerson, TypedDictPerson
 
 
@@ -19,36 +18,35 @@ def test_spec_generation(cls: Any) -> None:
     def handler(data: cls) -> cls:
         return data
 
-    with create_test_client(handler) as client:
-        schema = client.app.openapi_schema
-        assert schema
-        assert schema.to_schema()["components"]["schemas"][cls.__name__] == {
-            "properties": {
-                "first_name": {"type": "string"},
-                "last_name": {"type": "string"},
-                "id": {"type": "string"},
-                "optional": {"oneOf": [{"type": "string"}, {"type": "null"}]},
-                "complex": {
-                    "type": "object",
-                    "additionalProperties": {
+    schema = Litestar(route_handlers=[handler]).openapi_schema
+    assert schema
+    assert schema.to_schema()["components"]["schemas"][cls.__name__] == {
+        "properties": {
+            "first_name": {"type": "string"},
+            "last_name": {"type": "string"},
+            "id": {"type": "string"},
+            "optional": {"oneOf": [{"type": "string"}, {"type": "null"}]},
+            "complex": {
+                "type": "object",
+                "additionalProperties": {
+                    "type": "array",
+                    "items": {"type": "object", "additionalProperties": {"type": "string"}},
+                },
+            },
+            "pets": {
+                "oneOf": [
+                    {
+                        "items": {"$ref": "#/components/schemas/DataclassPet"},
                         "type": "array",
-                        "items": {"type": "object", "additionalProperties": {"type": "string"}},
                     },
-                },
-                "pets": {
-                    "oneOf": [
-                        {
-                            "items": {"$ref": "#/components/schemas/DataclassPet"},
-                            "type": "array",
-                        },
-                        {"type": "null"},
-                    ]
-                },
+                    {"type": "null"},
+                ]
             },
-            "type": "object",
-            "required": ["complex", "first_name", "id", "last_name"],
-            "title": f"{cls.__name__}",
-        }
+        },
+        "type": "object",
+        "required": ["complex", "first_name", "id", "last_name"],
+        "title": f"{cls.__name__}",
+    }
 
 
 def test_spec_generation_no_content() -> None:
@@ -60,22 +58,21 @@ def test_spec_generation_no_content() -> None:
     def handler() -> None:
         return None
 
-    with create_test_client(handler) as client:
-        schema: OpenAPI = client.app.openapi_schema
-        assert schema.to_schema()["paths"] == {
-            "/": {
-                "delete": {
-                    "summary": "Handler",
-                    "deprecated": False,
-                    "operationId": "Handler",
-                    "responses": {
-                        "204": {
-                            "description": "Custom response",
-                        }
-                    },
+    schema: OpenAPI = Litestar(route_handlers=[handler]).openapi_schema
+    assert schema.to_schema()["paths"] == {
+        "/": {
+            "delete": {
+                "summary": "Handler",
+                "deprecated": False,
+                "operationId": "Handler",
+                "responses": {
+                    "204": {
+                        "description": "Custom response",
+                    }
                 },
             },
-        }
+        },
+    }
 
 
 def test_msgspec_schema() -> None:
@@ -87,16 +84,15 @@ def test_msgspec_schema() -> None:
     def handler(data: CamelizedStruct) -> CamelizedStruct:
         return data
 
-    with create_test_client(handler) as client:
-        schema = client.app.openapi_schema
-        assert schema
+    schema = Litestar(route_handlers=[handler]).openapi_schema
+    assert schema
 
-        assert schema.to_schema()["components"]["schemas"]["test_msgspec_schema.CamelizedStruct"] == {
-            "properties": {"fieldOne": {"type": "integer"}, "fieldTwo": {"type": "number"}},
-            "required": ["fieldOne", "fieldTwo"],
-            "title": "CamelizedStruct",
-            "type": "object",
-        }
+    assert schema.to_schema()["components"]["schemas"]["test_msgspec_schema.CamelizedStruct"] == {
+        "properties": {"fieldOne": {"type": "integer"}, "fieldTwo": {"type": "number"}},
+        "required": ["fieldOne", "fieldTwo"],
+        "title": "CamelizedStruct",
+        "type": "object",
+    }
 
 
 @pytest.fixture()
@@ -181,32 +177,32 @@ def test_recursive_schema_generation(
 ) -> None:
     module_content = request.getfixturevalue(fixture_name)
     module = create_module(module_content)
-    with create_test_client(module.test, debug=True) as client:
-        schema = client.app.openapi_schema
-        assert schema
-        assert schema.to_schema()["components"]["schemas"]["A"] == {
-            "required": ["a", "b"],
-            "properties": {
-                "a": {"$ref": "#/components/schemas/A"},
-                "b": {"$ref": "#/components/schemas/B"},
-                "opt_a": {"oneOf": [{"$ref": "#/components/schemas/A"}, {"type": "null"}]},
-                "opt_b": {"oneOf": [{"$ref": "#/components/schemas/B"}, {"type": "null"}]},
-                "list_a": {"items": {"$ref": "#/components/schemas/A"}, "type": "array"},
-                "list_b": {"items": {"$ref": "#/components/schemas/B"}, "type": "array"},
-            },
-            "type": "object",
-            "title": "A",
-        }
-        assert schema.to_schema()["components"]["schemas"]["B"] == {
-            "required": ["a", "b"],
-            "properties": {
-                "a": {"$ref": "#/components/schemas/A"},
-                "b": {"$ref": "#/components/schemas/B"},
-                "opt_a": {"oneOf": [{"$ref": "#/components/schemas/A"}, {"type": "null"}]},
-                "opt_b": {"oneOf": [{"$ref": "#/components/schemas/B"}, {"type": "null"}]},
-                "list_a": {"items": {"$ref": "#/components/schemas/A"}, "type": "array"},
-                "list_b": {"items": {"$ref": "#/components/schemas/B"}, "type": "array"},
-            },
-            "type": "object",
-            "title": "B",
-        }
+    schema = Litestar(route_handlers=[module.test], debug=True).openapi_schema
+    assert schema
+    schemas = schema.to_schema()["components"]["schemas"]
+    assert schemas["A"] == {
+        "required": ["a", "b"],
+        "properties": {
+            "a": {"$ref": "#/components/schemas/A"},
+            "b": {"$ref": "#/components/schemas/B"},
+            "opt_a": {"oneOf": [{"$ref": "#/components/schemas/A"}, {"type": "null"}]},
+            "opt_b": {"oneOf": [{"$ref": "#/components/schemas/B"}, {"type": "null"}]},
+            "list_a": {"items": {"$ref": "#/components/schemas/A"}, "type": "array"},
+            "list_b": {"items": {"$ref": "#/components/schemas/B"}, "type": "array"},
+        },
+        "type": "object",
+        "title": "A",
+    }
+    assert schemas["B"] == {
+        "required": ["a", "b"],
+        "properties": {
+            "a": {"$ref": "#/components/schemas/A"},
+            "b": {"$ref": "#/components/schemas/B"},
+            "opt_a": {"oneOf": [{"$ref": "#/components/schemas/A"}, {"type": "null"}]},
+            "opt_b": {"oneOf": [{"$ref": "#/components/schemas/B"}, {"type": "null"}]},
+            "list_a": {"items": {"$ref": "#/components/schemas/A"}, "type": "array"},
+            "list_b": {"items": {"$ref": "#/components/schemas/B"}, "type": "array"},
+        },
+        "type": "object",
+        "title": "B",
+    }
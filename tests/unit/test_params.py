@@ -148,34 +148,49 @@ def test_dependency_provided_on_controller() -> None:
     assert resp.json() == {"value": 13}
 
 
-def test_dependency_skip_validation() -> None:
-    @get("/validated")
-    def validated(value: int = Dependency()) -> Dict[str, int]:
-        return {"value": value}
+def provide_str() -> str:
+    return "str"
+
+
+@get("/validated", dependencies={"value": Provide(provide_str, sync_to_thread=False)}, sync_to_thread=False)
+def validated_dependency_handler(value: int = Dependency()) -> Dict[str, int]:
+    return {"value": value}
+
+
+@get("/skipped", dependencies={"value": Provide(provide_str, sync_to_thread=False)}, sync_to_thread=False)
+def skipped_dependency_handler(value: int = Dependency(skip_validation=True)) -> Dict[str, int]:
+    return {"value": value}
+
+
+@get("/skipped-default", sync_to_thread=False)
+def skipped_dependency_default_handler(value: int = Dependency(default=1, skip_validation=True)) -> Dict[str, int]:
+    return {"value": value}
 
-    @get("/skipped")
-    def skipped(value: int = Dependency(skip_validation=True)) -> Dict[str, int]:
-        return {"value": value}
 
+@pytest.fixture(name="skip_validation_client", scope="module")
+def skip_validation_client_fixture() -> Generator[TestClient, None, None]:
     with create_test_client(
-        route_handlers=[validated, skipped], dependencies={"value": Provide(lambda: "str", sync_to_thread=False)}
+        route_handlers=[validated_dependency_handler, skipped_dependency_handler, skipped_dependency_default_handler],
+        openapi_config=None,
     ) as client:
-        validated_resp = client.get("/validated")
-        assert validated_resp.status_code == HTTP_500_INTERNAL_SERVER_ERROR
-        skipped_resp = client.get("/skipped")
-        assert skipped_resp.status_code == HTTP_200_OK
-        assert skipped_resp.json() == {"value": "str"}
-
+        yield client
 
-def test_dependency_skip_validation_with_default() -> None:
-    @get("/skipped")
-    def skipped(value: int = Dependency(default=1, skip_validation=True)) -> Dict[str, int]:
-        return {"value": value}
 
-    with create_test_client(route_handlers=[skipped]) as client:
-        skipped_resp = client.get("/skipped")
-        assert skipped_resp.status_code == HTTP_200_OK
-        assert skipped_resp.json() == {"value": 1}
+@pytest.mark.parametrize(
+    "path, expected_status_code, expected_json",
+    [
+        ("/validated", HTTP_500_INTERNAL_SERVER_ERROR, None),
+        ("/skipped", HTTP_200_OK, {"value": "str"}),
+        ("/skipped-default", HTTP_200_OK, {"value": 1}),
+    ],
+)
+def test_dependency_skip_validation(
+    skip_validation_client: TestClient, path: str, expected_status_code: int, expected_json: Optional[Dict[str, Any]]
+) -> None:
+    response = skip_validation_client.get(path)
+    assert response.status_code == expected_status_code
+    if expected_json is not None:
+        assert response.json() == expected_json
 
 
 def test_dependency_nested_sequence() -> None:
@@ -1,11 +1,12 @@
 from pathlib import PurePosixPath
-from typing import Any, Optional
+from typing import Any, Iterator, Optional, Tuple
 
 import pytest
 
 from litestar import MediaType, get
 from litestar.datastructures import Cookie
 from litestar.exceptions import ImproperlyConfiguredException
+from litestar.handlers import HTTPRouteHandler
 from litestar.response import Response
 from litestar.response.base import ASGIResponse
 from litestar.serialization import default_serializer, get_serializer
@@ -19,7 +20,7 @@ from litestar.status_codes import (
     HTTP_304_NOT_MODIFIED,
     HTTP_500_INTERNAL_SERVER_ERROR,
 )
-from litestar.testing import create_test_client
+from litestar.testing import TestClient, create_test_client
 from litestar.types import Empty
 
 
@@ -150,37 +151,55 @@ def test_statuses_without_body(status: int, body: Optional[str], should_raise: b
             assert "content-length" not in response.headers
 
 
-@pytest.mark.parametrize(
-    "body, media_type, should_raise",
-    (
-        ("", MediaType.TEXT, False),
-        ("abc", MediaType.TEXT, False),
-        (b"", MediaType.HTML, False),
-        (b"abc", MediaType.HTML, False),
-        ({"key": "value"}, MediaType.TEXT, True),
-        ([1, 2, 3], MediaType.TEXT, True),
-        ({"key": "value"}, MediaType.HTML, True),
-        ([1, 2, 3], MediaType.HTML, True),
-        ([], MediaType.HTML, False),
-        ([], MediaType.TEXT, False),
-        ({}, MediaType.HTML, False),
-        ({}, MediaType.TEXT, False),
-        ({"abc": "def"}, MediaType.JSON, False),
-        (Empty, MediaType.JSON, True),
-        ({"key": "value"}, "application/something+json", False),
-    ),
+RENDER_CASES: Tuple[Tuple[Any, str, bool], ...] = (
+    ("", MediaType.TEXT, False),
+    ("abc", MediaType.TEXT, False),
+    (b"", MediaType.HTML, False),
+    (b"abc", MediaType.HTML, False),
+    ({"key": "value"}, MediaType.TEXT, True),
+    ([1, 2, 3], MediaType.TEXT, True),
+    ({"key": "value"}, MediaType.HTML, True),
+    ([1, 2, 3], MediaType.HTML, True),
+    ([], MediaType.HTML, False),
+    ([], MediaType.TEXT, False),
+    ({}, MediaType.HTML, False),
+    ({}, MediaType.TEXT, False),
+    ({"abc": "def"}, MediaType.JSON, False),
+    (Empty, MediaType.JSON, True),
+    ({"key": "value"}, "application/something+json", False),
 )
-def test_render_method(body: Any, media_type: str, should_raise: bool) -> None:
-    @get("/", media_type=media_type)
+
+
+def create_render_handler(index: int, body: Any, media_type: str) -> HTTPRouteHandler:
+    @get(f"/render/{index}", media_type=media_type)
     def handler() -> Any:
         return body
 
-    with create_test_client(handler) as client:
-        response = client.get("/")
-        if should_raise:
-            assert response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
-        else:
-            assert response.status_code == HTTP_200_OK
+    return handler
+
+
+@pytest.fixture(scope="module")
+def render_client() -> Iterator[TestClient]:
+    route_handlers = [
+        create_render_handler(index, body, media_type) for index, (body, media_type, _) in enumerate(RENDER_CASES)
+    ]
+    with create_test_client(route_handlers) as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    "index, should_raise",
+    [
+        pytest.param(index, should_raise, id=f"{body!r}-{media_type}")
+        for index, (body, media_type, should_raise) in enumerate(RENDER_CASES)
+    ],
+)
+def test_render_method(render_client: TestClient, index: int, should_raise: bool) -> None:
+    response = render_client.get(f"/render/{index}")
+    if should_raise:
+        assert response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
+    else:
+        assert response.status_code == HTTP_200_OK
 
 
 def test_get_serializer() -> None:
@@ -12,27 +12,34 @@ from litestar.template.config import TemplateConfig
 from litestar.testing import create_test_client
 
 
+@pytest.fixture(scope="module")
+def template_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    directory = tmp_path_factory.mktemp("templates")
+    Path(directory / "jinja.html").write_text('path: {{ request.scope["path"] }}')
+    Path(directory / "mako.html").write_text('path: ${request.scope["path"]}')
+    return directory
+
+
 @pytest.mark.parametrize(
-    "engine, template, expected",
+    "engine, template_name, expected",
     (
-        (JinjaTemplateEngine, 'path: {{ request.scope["path"] }}', "path: /"),
-        (MakoTemplateEngine, 'path: ${request.scope["path"]}', "path: /"),
-        (MiniJinjaTemplateEngine, 'path: {{ request.scope["path"] }}', "path: &#x2f;"),
+        (JinjaTemplateEngine, "jinja.html", "path: /"),
+        (MakoTemplateEngine, "mako.html", "path: /"),
+        (MiniJinjaTemplateEngine, "jinja.html", "path: &#x2f;"),
     ),
 )
-def test_request_is_set_in_context(engine: Any, template: str, expected: str, tmp_path: Path) -> None:
-    Path(tmp_path / "abc.html").write_text(template)
-
+def test_request_is_set_in_context(engine: Any, template_name: str, expected: str, template_dir: Path) -> None:
     @get(path="/", media_type=MediaType.HTML)
     def handler() -> Template:
-        return Template(template_name="abc.html", context={"request": {"scope": {"path": "nope"}}})
+        return Template(template_name=template_name, context={"request": {"scope": {"path": "nope"}}})
 
     with create_test_client(
         route_handlers=[handler],
         template_config=TemplateConfig(
-            directory=tmp_path,
+            directory=template_dir,
             engine=engine,
         ),
+        openapi_config=None,
     ) as client:
         response = client.get("/")
         assert response.text == expected
@@ -296,6 +296,16 @@ def test_field_definition_hash() -> None:
     )
 
 
+def test_field_definition_from_annotation_is_cached() -> None:
+    first, second = FieldDefinition.from_annotation(List[int]), FieldDefinition.from_annotation(List[int])
+    assert first == second
+    assert first.inner_types is second.inner_types
+    assert first.extra is not second.extra
+    assert FieldDefinition.from_annotation(Union[str, int]).args == (str, int)
+    assert FieldDefinition.from_annotation(Union[int, str]).args == (int, str)
+    assert FieldDefinition.from_annotation(int, name="foo") is not FieldDefinition.from_annotation(int, name="foo")
+
+
 def test_is_required() -> None:
     class Foo(TypedDict):
         required: Required[str]
@@ -14,10 +14,10 @@ if TYPE_CHECKING:
     from docutils.nodes import Element, Node
     from sphinx.addnodes import pending_xref
     from sphinx.application import Sphinx
+    from sphinx.config import Config
     from sphinx.environment import BuildEnvironment
 
 
-@cache
 def _get_module_ast(source_file: str) -> ast.AST | ast.Module:
     return ast.parse(Path(source_file).read_text())
 
@@ -31,7 +31,13 @@ def _get_import_nodes(nodes: list[ast.stmt]) -> Generator[ast.Import | ast.Impor
 
 
 @cache
-def get_module_global_imports(module_import_path: str, reference_target_source_obj: str) -> set[str]:
+def _get_source_file_global_imports(source_file: str) -> frozenset[str]:
+    import_nodes = _get_import_nodes(_get_module_ast(source_file).body)
+    return frozenset(path.asname or path.name for import_node in import_nodes for path in import_node.names)
+
+
+@cache
+def get_module_global_imports(module_import_path: str, reference_target_source_obj: str) -> frozenset[str]:
     """Return a set of names that are imported globally within the containing module of ``reference_target_source_obj``,
     including imports in ``if TYPE_CHECKING`` blocks.
     """
@@ -39,12 +45,14 @@ def get_module_global_imports(module_import_path: str, reference_target_source_o
     obj = getattr(module, reference_target_source_obj)
 
     try:
-        tree = _get_module_ast(inspect.getsourcefile(obj))
+        source_file = inspect.getsourcefile(obj)
     except TypeError:
-        return set()
+        return frozenset()
+
+    if source_file is None:
+        return frozenset()
 
-    import_nodes = _get_import_nodes(tree.body)
-    return {path.asname or path.name for import_node in import_nodes for path in import_node.names}
+    return _get_source_file_global_imports(source_file)
 
 
 def on_warn_missing_reference(app: Sphinx, domain: str, node: Node) -> bool | None:
@@ -58,7 +66,9 @@ def on_warn_missing_reference(app: Sphinx, domain: str, node: Node) -> bool | No
     attributes = node.attributes  # type: ignore[attr-defined]
     target = attributes["reftarget"]
 
-    if reference_target_source_obj := attributes.get("py:class", attributes.get("py:meth", attributes.get("py:func"))):
+    if reference_target_source_obj := (
+        attributes.get("py:class") or attributes.get("py:meth") or attributes.get("py:func")
+    ):
         global_names = get_module_global_imports(attributes["py:module"], reference_target_source_obj)
 
         if target in global_names:
@@ -75,8 +85,7 @@ def on_warn_missing_reference(app: Sphinx, domain: str, node: Node) -> bool | No
     source = source_line.split(" ")[-1]
     if target in ignore_refs.get(source, []):
         return True
-    ignore_ref_rgs = {rg: targets for rg, targets in ignore_refs.items() if isinstance(rg, re.Pattern)}
-    for pattern, targets in ignore_ref_rgs.items():
+    for pattern, targets in app.ignore_missing_ref_patterns:
         if not pattern.match(source):
             continue
         if isinstance(targets, set):
@@ -88,31 +97,52 @@ def on_warn_missing_reference(app: Sphinx, domain: str, node: Node) -> bool | No
     return None
 
 
+_unresolvable_refs: set[tuple[str, str, str | None, str | None]] = set()
+
+
 def on_missing_reference(app: Sphinx, env: BuildEnvironment, node: pending_xref, contnode: Element) -> Any:
     if not hasattr(node, "attributes"):
         return None
 
     attributes = node.attributes  # type: ignore[attr-defined]
     target = attributes["reftarget"]
+    refdoc = attributes["refdoc"]
     py_domain = env.domains["py"]
 
+    # the same target in the same context will fail to resolve again, so don't repeat the lookups
+    unresolvable_key = (refdoc, target, attributes.get("py:module"), attributes.get("py:class"))
+    if unresolvable_key in _unresolvable_refs:
+        return None
+
     # autodoc sometimes incorrectly resolves these types, so we try to resolve them as py:data fist and fall back to any
-    new_node = py_domain.resolve_xref(env, node["refdoc"], app.builder, "data", target, node, contnode)
+    new_node = py_domain.resolve_xref(env, refdoc, app.builder, "data", target, node, contnode)
     if new_node is None:
-        resolved_xrefs = py_domain.resolve_any_xref(env, node["refdoc"], app.builder, target, node, contnode)
+        resolved_xrefs = py_domain.resolve_any_xref(env, refdoc, app.builder, target, node, contnode)
         for ref in resolved_xrefs:
             if ref:
                 return ref[1]
+        _unresolvable_refs.add(unresolvable_key)
     return new_node
 
 
+def on_config_inited(app: Sphinx, config: Config) -> None:
+    # split off the pattern based entries once, so they don't have to be filtered out for every missing reference
+    app.ignore_missing_ref_patterns = [
+        (pattern, targets)
+        for pattern, targets in config["ignore_missing_refs"].items()
+        if isinstance(pattern, re.Pattern)
+    ]
+
+
 def on_env_before_read_docs(app: Sphinx, env: BuildEnvironment, docnames: set[str]) -> None:
     tmp_examples_path = Path.cwd() / "docs/_build/_tmp_examples"
     tmp_examples_path.mkdir(exist_ok=True, parents=True)
     env.tmp_examples_path = tmp_examples_path
+    _unresolvable_refs.clear()
 
 
 def setup(app: Sphinx) -> dict[str, bool]:
+    app.connect("config-inited", on_config_inited)
     app.connect("env-before-read-docs", on_env_before_read_docs)
     app.connect("missing-reference", on_missing_reference)
     app.connect("warn-missing-reference", on_warn_missing_reference)
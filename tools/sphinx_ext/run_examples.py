@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import argparse
+import ast
+import hashlib
 import importlib
 import logging
 import multiprocessing
@@ -7,12 +10,12 @@ import os
 import re
 import shlex
 import socket
-import subprocess
 import sys
 import time
 from contextlib import contextmanager, redirect_stderr
+from functools import cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Generator
+from typing import TYPE_CHECKING, Any, Generator, Iterator
 
 import httpx
 import uvicorn
@@ -21,13 +24,16 @@ from docutils.nodes import Node, admonition, literal_block, title
 from docutils.parsers.rst import directives
 from sphinx.addnodes import highlightlang
 
+import litestar
 from litestar import Litestar
 
 if TYPE_CHECKING:
     from sphinx.application import Sphinx
 
 
-RGX_RUN = re.compile(r"# +?run:(.*)")
+RGX_RUN = re.compile(r"^# +?run:(.*)$\n?", re.MULTILINE)
+
+EXEC_CACHE_MAX_ENTRIES = 500
 
 
 logger = logging.getLogger("sphinx")
@@ -40,8 +46,11 @@ class StartupError(RuntimeError):
 
 
 def _load_app_from_path(path: Path) -> Litestar:
-    module = importlib.import_module(str(path.with_suffix("")).replace("/", "."))
-    for obj in module.__dict__.values():
+    module = importlib.import_module(".".join(path.with_suffix("").parts))
+    app = getattr(module, "app", None)
+    if isinstance(app, Litestar):
+        return app
+    for obj in vars(module).values():
         if isinstance(obj, Litestar):
             return obj
     raise RuntimeError(f"No Litestar app found in {path}")
@@ -58,11 +67,25 @@ def _get_available_port() -> int:
             return sock.getsockname()[1]
 
 
+def _wait_for_port(port: int, timeout: float = 10) -> bool:
+    """Wait until a server accepts connections on ``port``, backing off exponentially between attempts."""
+    deadline = time.monotonic() + timeout
+    delay = 0.005
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return True
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.1)
+    return False
+
+
 @contextmanager
 def run_app(path: Path) -> Generator[int, None, None]:
     """Run an example app from a python file.
 
-    The first ``Litestar`` instance found in the file will be used as target to run.
+    The module level ``app`` will be used as target to run, falling back to the first ``Litestar`` instance found in
+    the file.
     """
 
     port = _get_available_port()
@@ -70,20 +93,14 @@ def run_app(path: Path) -> Generator[int, None, None]:
 
     def run() -> None:
         with redirect_stderr(Path(os.devnull).open()):
-            uvicorn.run(app, port=port, access_log=False)
+            uvicorn.run(app, port=port, access_log=False, log_level="critical")
 
     count = 0
     while count < 100:
         proc = multiprocessing.Process(target=run)
         proc.start()
         try:
-            for _ in range(100):
-                try:
-                    httpx.get(f"http://127.0.0.1:{port}", timeout=0.1)
-                    break
-                except httpx.TransportError:
-                    time.sleep(0.1)
-            else:
+            if not _wait_for_port(port):
                 raise StartupError(f"App {path} failed to come online")
 
             yield port
@@ -104,15 +121,25 @@ def extract_run_args(content: str) -> tuple[str, list[list[str]]]:
 
     Return the file content stripped of the run comments and a list of argument lists
     """
-    new_lines = []
-    run_configs = []
-    for line in content.splitlines():
-        if run_stmt_match := RGX_RUN.match(line):
-            run_stmt = run_stmt_match.group(1).lstrip()
-            run_configs.append(shlex.split(run_stmt))
-        else:
-            new_lines.append(line)
-    return "\n".join(new_lines), run_configs
+    run_configs = [shlex.split(run_stmt.lstrip()) for run_stmt in RGX_RUN.findall(content)]
+    return RGX_RUN.sub("", content), run_configs
+
+
+_curl_parser = argparse.ArgumentParser(prog="curl", add_help=False)
+_curl_parser.add_argument("-X", "--request", dest="method")
+_curl_parser.add_argument("-H", "--header", dest="headers", action="append", default=[])
+_curl_parser.add_argument("-d", "--data", dest="content")
+
+
+def parse_curl_options(options: list[str]) -> dict[str, Any]:
+    """Translate the subset of curl options used in the examples into ``httpx`` request arguments."""
+    parsed = _curl_parser.parse_args(options)
+    # like curl, sending data without an explicit method implies a POST request
+    method = parsed.method or ("POST" if parsed.content is not None else "GET")
+    headers = [tuple(part.strip() for part in header.split(":", 1)) for header in parsed.headers]
+    if parsed.content is not None and not any(name.lower() == "content-type" for name, _ in headers):
+        headers.append(("Content-Type", "application/x-www-form-urlencoded"))
+    return {"method": method, "headers": headers, "content": parsed.content}
 
 
 def exec_examples(app_file: Path, run_configs: list[list[str]]) -> str:
@@ -120,30 +147,106 @@ def exec_examples(app_file: Path, run_configs: list[list[str]]) -> str:
     and return their results
     """
 
-    results = []
+    lines: list[str] = []
 
-    with run_app(app_file) as port:
+    with run_app(app_file) as port, httpx.Client(base_url=f"http://127.0.0.1:{port}") as client:
+        # requests are sent in order, as some examples depend on the state left by a previous one
         for run_args in run_configs:
             url_path, *options = run_args
-            args = ["curl", "-s", f"http://127.0.0.1:{port}{url_path}", *options]
             clean_args = ["curl", f"http://127.0.0.1:8000{url_path}", *options]
 
-            proc = subprocess.run(  # noqa: PLW1510, S603
-                args,
-                capture_output=True,
-                text=True,
-            )
-            stdout = proc.stdout.splitlines()
+            try:
+                response = client.request(url=url_path, **parse_curl_options(options))
+            except httpx.HTTPError as e:
+                logger.debug(e)
+                stdout = []
+            else:
+                stdout = response.text.splitlines()
+
             if not stdout:
-                logger.debug(proc.stderr)
                 if not ignore_missing_output:
-                    logger.error(f"Example: {app_file}:{args} yielded no results")
+                    logger.error(f"Example: {app_file}:{run_args} yielded no results")
                 continue
 
-            result = "\n".join(("> " + (" ".join(clean_args)), *stdout))
-            results.append(result)
+            lines.append("> " + " ".join(clean_args))
+            lines.extend(stdout)
+
+    return "\n".join(lines)
+
+
+@cache
+def _get_litestar_source_stamp() -> str:
+    """Return a digest of the paths, sizes and modification times of litestar's source files."""
+    digest = hashlib.sha256()
+    for path in sorted(Path(litestar.__file__).parent.rglob("*.py")):
+        stat = path.stat()
+        digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
 
-    return "\n".join(results)
+def _resolve_module_file(module_path: Path) -> Path | None:
+    for candidate in (module_path.with_suffix(".py"), module_path / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _iter_local_imports(module_file: Path) -> Iterator[Path]:
+    """Yield the files of modules imported by ``module_file`` that are part of the docs, i.e. imported relatively or
+    from the ``docs`` package.
+    """
+    for node in ast.walk(ast.parse(module_file.read_text())):
+        if isinstance(node, ast.Import):
+            module_paths = [Path(*alias.name.split(".")) for alias in node.names if alias.name.startswith("docs.")]
+        elif isinstance(node, ast.ImportFrom) and (node.level or (node.module or "").startswith("docs.")):
+            base = module_file.parents[node.level - 1] if node.level else Path()
+            module_path = base.joinpath(*node.module.split(".")) if node.module else base
+            # imported names may be submodules as well as attributes
+            module_paths = [module_path, *(module_path / alias.name for alias in node.names)]
+        else:
+            continue
+
+        for module_path in module_paths:
+            if (resolved := _resolve_module_file(module_path)) is not None:
+                yield resolved
+
+
+def _get_local_imports_stamp(app_file: Path) -> list[tuple[str, int]]:
+    """Return the modification times of all docs modules ``app_file`` imports, directly or indirectly."""
+    seen: set[Path] = set()
+    pending = [app_file]
+    while pending:
+        for module_file in _iter_local_imports(pending.pop()):
+            if module_file not in seen:
+                seen.add(module_file)
+                pending.append(module_file)
+    return sorted((str(module_file), module_file.stat().st_mtime_ns) for module_file in seen)
+
+
+def exec_examples_cached(app_file: Path, content: str, run_configs: list[list[str]], cache_dir: Path) -> str:
+    """Like :func:`exec_examples`, but reuse the results of a previous build if neither the example, its run configs,
+    the docs modules it imports nor litestar itself have changed since.
+    """
+    stamps = f"{_get_litestar_source_stamp()}{_get_local_imports_stamp(app_file)!r}"
+    key = hashlib.sha256(f"{app_file}{content}{run_configs!r}{stamps}".encode()).hexdigest()
+    cache_file = cache_dir / key
+    if cache_file.exists():
+        cache_file.touch()
+        return cache_file.read_text()
+
+    result = exec_examples(app_file, run_configs)
+    if not result:
+        return result
+
+    cache_dir.mkdir(exist_ok=True)
+    cache_file.write_text(result)
+
+    # evict the least recently used entries
+    entries = sorted(cache_dir.iterdir(), key=lambda entry: entry.stat().st_mtime)
+    for entry in entries[:-EXEC_CACHE_MAX_ENTRIES]:
+        entry.unlink(missing_ok=True)
+
+    return result
 
 
 class LiteralInclude(LiteralIncludeOverride):
@@ -171,7 +274,9 @@ class LiteralInclude(LiteralIncludeOverride):
 
         nodes = super().run()
 
-        result = exec_examples(file_path.relative_to(cwd), run_args)
+        result = exec_examples_cached(
+            file_path.relative_to(cwd), content, run_args, cache_dir=self.env.tmp_examples_path / ".exec_cache"
+        )
 
         nodes.append(
             admonition(